@@ -1,19 +1,41 @@
 """Application configuration via environment variables.
 
-WHY: Pydantic Settings provides type-safe config with automatic env var
-parsing, .env file support, and validation at startup. This catches
-misconfiguration early instead of at runtime when a feature is first used.
+WHY: A frozen dataclass populated from TSCRIBE_* environment variables gives
+us type-safe config without importing pydantic-settings on every API and
+worker boot (settings are read once per process and never re-validated).
+Values are still parsed and coerced at startup, so misconfiguration fails
+early instead of at runtime when a feature is first used.
 """
 
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from pydantic_settings import BaseSettings
 
+# WHY: All backend variables share one prefix so they are easy to spot in
+# docker-compose env files and never collide with third-party variables.
+_ENV_PREFIX = "TSCRIBE_"
+_ENV_FILE = ".env"
 
-class Settings(BaseSettings):
+# WHY: Async driver suffixes mapped to the sync driver the worker uses for
+# the same database. An empty replacement selects SQLAlchemy's default
+# driver for the dialect (pysqlite for sqlite).
+_SYNC_DRIVERS = {"+aiosqlite": "", "+asyncpg": "+psycopg2", "+asyncmy": "+pymysql"}
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off", ""}
+
+
+@dataclass(frozen=True)
+class Settings:
     """Central configuration for all backend services.
 
     WHY: Single source of truth for configuration avoids scattered os.getenv()
     calls and makes it easy to see all configurable parameters at a glance.
+    Frozen because settings are facts about the deployment - they should not
+    be mutated after startup.
     """
 
     # API
@@ -24,7 +46,7 @@ class Settings(BaseSettings):
     # (Vite on :5173) and tunnel setups (any external domain), wildcard is safe
     # because the API has no cookie-based auth. Override via TSCRIBE_CORS_ORIGINS
     # for stricter control (e.g., "https://tscribe.example.com,http://localhost:5173").
-    cors_origins: list[str] = ["*"]
+    cors_origins: list[str] = field(default_factory=lambda: ["*"])
     # WHY: Configurable log level so production runs at INFO but developers
     # can set TSCRIBE_LOG_LEVEL=DEBUG without code changes.
     log_level: str = "INFO"
@@ -33,6 +55,11 @@ class Settings(BaseSettings):
     # WHY: SQLite for simplicity - single file, no extra service needed.
     # Async via aiosqlite for non-blocking I/O in FastAPI.
     database_url: str = "sqlite+aiosqlite:////data/tscribe.db"
+    # WHY: The API creates/migrates the schema on startup by default so a
+    # single-container deploy works out of the box. Deployments with several
+    # API replicas set this to false and run `python -m app.migrate` once
+    # (init container, deploy hook) instead of repeating the DDL per process.
+    run_migrations: bool = True
 
     # Redis
     # WHY: Redis as job queue backend because RQ (Redis Queue) is simpler
@@ -46,8 +73,24 @@ class Settings(BaseSettings):
     # WHY: GPU dramatically speeds up transcription (10-50x).
     # Falls back to CPU automatically if CUDA unavailable.
     whisper_device: str = "auto"
-    # WHY: int8 quantization cuts VRAM usage ~50% with minimal quality loss.
-    whisper_compute_type: str = "int8"
+    # WHY: "auto" picks int8 on CPU and int8_float16 on CUDA: int8 weights
+    # cut memory ~4x vs float32 with minimal quality loss, and CTranslate2
+    # uses int8 GEMM kernels where the CPU/GPU supports them. Set an explicit
+    # type (int8, float16, float32, ...) to override.
+    whisper_compute_type: str = "auto"
+    # WHY: Silero VAD strips silence before decoding, so the decoder does not
+    # spend steps (or hallucinate text) on pauses, music beds and intros -
+    # typically 20-50% less audio to decode for podcast/video content.
+    whisper_vad_filter: bool = True
+    # WHY: Feeding the previous window's text back as a prompt can lock
+    # Whisper into repetition loops that slow decoding and garble output.
+    # Off by default; enable for more consistent style across windows.
+    whisper_condition_on_previous_text: bool = False
+    # WHY: Number of RQ worker processes run_worker.py starts. One job at a
+    # time is right for a single GPU or a small CPU box; on a many-core CPU
+    # host, several workers keep the cores (and the NIC, while other jobs
+    # download) busy. Each worker loads its own Whisper model.
+    worker_concurrency: int = 1
 
     # Job execution
     # WHY: RQ defaults to 180s timeout which is too short for large video
@@ -60,7 +103,110 @@ class Settings(BaseSettings):
     # WHY: 24h auto-cleanup prevents disk from filling up with old transcriptions.
     cleanup_max_age_hours: int = 24
 
-    model_config = {"env_file": ".env", "env_prefix": "TSCRIBE_"}
+    @property
+    def sync_database_url(self) -> str:
+        """database_url with its async driver swapped for a sync one.
+
+        WHY: The RQ worker has no event loop and uses a sync engine on the
+        same database. Deriving the URL here keeps the mapping in one place
+        and covers drivers other than aiosqlite.
+        """
+        scheme, sep, rest = self.database_url.partition("://")
+        for async_driver, sync_driver in _SYNC_DRIVERS.items():
+            if scheme.endswith(async_driver):
+                scheme = scheme.removesuffix(async_driver) + sync_driver
+                break
+        return scheme + sep + rest
+
+
+def _read_env_file(path: str | Path) -> dict[str, str]:
+    """Read KEY=VALUE pairs from a dotenv file, if it exists.
+
+    WHY: Local development runs the backend outside Docker Compose, where
+    .env is not injected into the environment. Only the simple subset of
+    the dotenv format used by .env.example is supported (comments, blank
+    lines, optional quotes).
+    """
+    values: dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                    value = value[1:-1]
+                values[key.strip()] = value
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def _coerce(name: str, raw: str, type_: object) -> object:
+    """Convert a raw environment string to the declared field type.
 
+    WHY: Environment variables are always strings. Explicit coercion per
+    type keeps parsing predictable and raises a clear error naming the
+    offending variable instead of failing later with a confusing TypeError.
+    """
+    if type_ is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{_ENV_PREFIX}{name.upper()}: expected a boolean, got {raw!r}")
+    if type_ is int:
+        try:
+            return int(raw)
+        except ValueError:
+            raise ValueError(
+                f"{_ENV_PREFIX}{name.upper()}: expected an integer, got {raw!r}"
+            ) from None
+    if type_ is Path:
+        return Path(raw)
+    if type_ == list[str]:
+        # WHY: Accept both the JSON list form (["a", "b"]) documented in
+        # .env.example and a plain comma-separated string.
+        raw = raw.strip()
+        if raw.startswith("["):
+            items = json.loads(raw)
+        else:
+            items = raw.split(",")
+        return [str(item).strip() for item in items if str(item).strip()]
+    return raw
+
+
+def _load(
+    environ: Mapping[str, str] = os.environ,
+    env_file: str | Path | None = _ENV_FILE,
+) -> Settings:
+    """Build Settings from TSCRIBE_* variables (environment wins over .env).
+
+    WHY: Iterating the dataclass fields keeps the loader in sync with the
+    Settings definition - adding a field automatically makes it configurable.
+    """
+    source = _read_env_file(env_file) if env_file else {}
+    source.update(environ)
+
+    overrides: dict[str, object] = {}
+    for f in fields(Settings):
+        raw = source.get(_ENV_PREFIX + f.name.upper())
+        if raw is not None:
+            overrides[f.name] = _coerce(f.name, raw, f.type)
+    return Settings(**overrides)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, parsing the environment on first use.
+
+    WHY: Parsing happens once per process no matter how often modules are
+    re-imported (workers, test harnesses). Matches FastAPI's documented
+    Depends(get_settings) idiom, and tests can call get_settings.cache_clear()
+    to pick up a changed environment.
+    """
+    return _load()
 
-settings = Settings()
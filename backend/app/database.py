@@ -6,20 +6,54 @@ it requires zero additional infrastructure - the database is just a file.
 For a transcription service with moderate concurrency this is sufficient.
 """
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from app.config import settings
+from app.config import get_settings
 
 # WHY: echo=False in production to avoid log spam. The check_same_thread
 # arg is SQLite-specific - needed because FastAPI serves from multiple threads
 # but SQLite's default is single-thread only.
 engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
+    get_settings().database_url,
+    echo=get_settings().debug,
     connect_args={"check_same_thread": False},
 )
 
+
+def set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """Tune every new SQLite connection for concurrent API reads + worker writes.
+
+    WHY: The default rollback journal (DELETE mode) blocks readers while the
+    worker writes progress updates, so frontend polls of /api/jobs/ stall.
+    WAL lets readers proceed during a write; synchronous=NORMAL is the
+    recommended (still crash-safe) pairing for WAL and avoids an fsync per
+    commit. busy_timeout makes a connection that does hit the write lock (the
+    API inserting a job while the worker commits progress) wait up to 5s
+    instead of failing immediately with SQLITE_BUSY. temp_store, mmap_size
+    and cache_size keep sorts and hot pages in memory instead of re-reading
+    them from the file.
+    Exposed (not underscore-private) so the worker's sync engine can use the
+    same settings.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")  # ms
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB (negative = KiB)
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
+# WHY: Bump whenever _migrate_add_columns gains a new step. Stored in the
+# database via PRAGMA user_version so already-migrated files skip the checks.
+_SCHEMA_VERSION = 3
+
 # WHY: expire_on_commit=False prevents lazy-load issues after commit
 # in async context where the session might already be closed.
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -67,11 +101,19 @@ async def _migrate_add_columns():
 
     WHY: When we add new nullable columns to models, existing SQLite databases
     won't have them. We check via PRAGMA and ALTER TABLE to add them safely.
-    This runs on every startup but is a no-op when columns already exist.
+    PRAGMA user_version records the last applied schema version, so after the
+    first successful run every startup is a single integer read instead of a
+    table_info scan.
     """
     import sqlalchemy
 
     async with engine.begin() as conn:
+        # WHY: user_version is a free integer slot in the SQLite header
+        # (0 for new files). Reading it is O(1) and needs no extra table.
+        result = await conn.execute(sqlalchemy.text("PRAGMA user_version"))
+        if result.scalar() >= _SCHEMA_VERSION:
+            return
+
         # WHY: PRAGMA table_info returns column metadata for the table.
         # We check if 'source' column exists before attempting to add it.
         result = await conn.execute(sqlalchemy.text("PRAGMA table_info(jobs)"))
@@ -81,3 +123,20 @@ async def _migrate_add_columns():
             await conn.execute(
                 sqlalchemy.text("ALTER TABLE jobs ADD COLUMN source VARCHAR(20)")
             )
+
+        # WHY: create_all() only creates indexes together with their table,
+        # so databases created before ix_jobs_created_at existed need it added.
+        await conn.execute(
+            sqlalchemy.text(
+                "CREATE INDEX IF NOT EXISTS ix_jobs_created_at ON jobs (created_at)"
+            )
+        )
+
+        # WHY: jobs.status used to be a SQLAlchemy Enum, which stores enum
+        # member names ("DONE"). It is now a plain string holding the values
+        # ("done"), which is also what run_worker's orphan recovery matches.
+        await conn.execute(sqlalchemy.text("UPDATE jobs SET status = lower(status)"))
+
+        # WHY: Written in the same transaction as the ALTERs so a failed
+        # migration is retried on the next startup.
+        await conn.execute(sqlalchemy.text(f"PRAGMA user_version = {_SCHEMA_VERSION}"))
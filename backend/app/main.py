@@ -9,11 +9,13 @@ changed per environment without code changes.
 import logging
 import sys
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.config import settings
+from app.config import get_settings
 from app.database import init_db
 from app.routes import health, jobs
 
@@ -21,7 +23,7 @@ from app.routes import health, jobs
 # so all library and application logs follow a consistent, parseable format.
 # Mirrors the pattern in run_worker.py for uniform log output across services.
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper(), logging.INFO),
+    level=getattr(logging, get_settings().log_level.upper(), logging.INFO),
     format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
     stream=sys.stdout,
 )
@@ -35,26 +37,39 @@ async def lifespan(app: FastAPI):
     WHY: Lifespan replaces the deprecated @app.on_event decorators and
     provides a single place for startup/shutdown logic. We create DB
     tables here so the app works immediately after first deploy without
-    manual migration steps.
+    manual migration steps. Multi-replica deployments can disable this
+    (TSCRIBE_RUN_MIGRATIONS=false) and run `python -m app.migrate` once.
     """
+    settings = get_settings()
     logger.info("Starting %s (debug=%s, log_level=%s)", settings.app_name, settings.debug, settings.log_level)
-    await init_db()
-    logger.info("Database initialized")
+    if settings.run_migrations:
+        await init_db()
+        logger.info("Database initialized")
+    else:
+        logger.info("Skipping database initialization (run_migrations=false)")
     yield
     logger.info("Shutting down")
 
 
+@lru_cache(maxsize=1)
 def create_app() -> FastAPI:
     """Application factory that wires together middleware and routes.
 
-    WHY: Factory pattern allows creating multiple app instances (e.g. for
-    testing with overridden settings) and keeps configuration logic in
-    one discoverable place rather than scattered at module level.
+    WHY: Factory pattern keeps configuration logic in one discoverable
+    place rather than scattered at module level. Cached so every caller
+    (uvicorn's app.main:app, test fixtures) shares one instance: route
+    setup clones the response models, which is the bulk of app startup
+    time. Tests customize the shared app via dependency_overrides and
+    clear them afterwards; call create_app.cache_clear() for a fresh app.
     """
+    settings = get_settings()
     app = FastAPI(
         title=settings.app_name,
         lifespan=lifespan,
         debug=settings.debug,
+        # WHY: orjson (C, SIMD) renders JSON bodies several times faster
+        # than the stdlib json module behind the default JSONResponse.
+        default_response_class=ORJSONResponse,
     )
 
     # WHY: CORS must be configured for the frontend dev server (Vite on :5173)
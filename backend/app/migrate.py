@@ -0,0 +1,43 @@
+"""One-shot database initialization and migration.
+
+WHY: By default every API process runs init_db() on startup. With several
+API replicas that repeats the same DDL round-trips on every start and lets
+replicas race on ALTER TABLE. This entry point runs the same init_db() once
+(e.g. as an init container or deploy step) so replicas can start with
+TSCRIBE_RUN_MIGRATIONS=false.
+
+Usage:
+    python -m app.migrate
+"""
+
+import asyncio
+import logging
+import sys
+
+import app.models  # noqa: F401 -- registers the tables on Base.metadata
+from app.database import engine, init_db
+
+logger = logging.getLogger("tscribe.migrate")
+
+
+async def _run() -> None:
+    """Create missing tables, apply column migrations, release connections."""
+    try:
+        await init_db()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Initialize the database schema and exit."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        stream=sys.stdout,
+    )
+    asyncio.run(_run())
+    logger.info("Database initialized")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,20 @@ a transcription request from submission to completion.
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, Float, Integer, String, Text
+from sqlalchemy import DateTime, Float, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
+# WHY: Bound once so the created_at default does a single global lookup per
+# insert instead of resolving the timezone.utc attribute each time.
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware current time, used as the created_at column default."""
+    return datetime.now(_UTC)
+
 
 class JobStatus(str, enum.Enum):
     """Transcription job lifecycle states.
@@ -43,8 +52,13 @@ class Job(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     url: Mapped[str] = mapped_column(String(2048))
-    status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus), default=JobStatus.QUEUED, index=True
+    # WHY plain String (not SQLAlchemy Enum): rows store the lowercase enum
+    # values ("queued", "done", ...) and load back as plain str, so there is
+    # no per-row JobStatus() coercion on the polled list endpoint. JobStatus
+    # is a str enum, so comparisons like `job.status == JobStatus.DONE` and
+    # assignments of JobStatus members keep working unchanged.
+    status: Mapped[str] = mapped_column(
+        String(20), default=JobStatus.QUEUED.value, index=True
     )
 
     # WHY: Store media title for display in the job list.
@@ -63,7 +77,13 @@ class Job(Base):
     # WHY: Plain text result for quick display. Segment-level data
     # (with timestamps) stored as JSON for format exports.
     result_text: Mapped[str | None] = mapped_column(Text, nullable=True)
-    result_segments_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # WHY deferred: The segments JSON is the largest value in the row (often
+    # several times result_text) but only the download endpoint reads it.
+    # Deferring keeps it out of every other SELECT, so status polls never
+    # pull its overflow pages from disk. Load it with undefer() when needed.
+    result_segments_json: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True
+    )
 
     # WHY: Store error message for failed jobs so the user knows what went wrong.
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -72,8 +92,11 @@ class Job(Base):
     # or Whisper transcription (slow path). None for jobs created before this field.
     source: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
+    # WHY: Indexed because list_jobs orders by created_at DESC LIMIT 50.
+    # Without the index SQLite sorts the whole table on every poll; with it
+    # the query walks the index backwards and stops after 50 rows.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), default=_utcnow, index=True
     )
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -5,28 +5,137 @@ maps to a clear user action: submit a URL, check status, view result,
 download formatted transcript, or clean up old jobs.
 """
 
+import asyncio
+import hashlib
 import ipaddress
-import json
 import logging
+import os
 import shutil
 import socket
+import time
 import uuid
+from collections.abc import Iterable, Iterator
 from urllib.parse import urlparse
 
-from fastapi import APIRouter, Depends, HTTPException, Response
-from redis import Redis
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from redis import BlockingConnectionPool, Redis
 from rq import Queue
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from app.config import settings
+from app.config import get_settings
 from app.database import get_db
 from app.models import Job, JobStatus
 from app.schemas import JobCreate, JobListResponse, JobResponse
 
+# WHY: formats and segments are dependency-free modules, so importing them
+# at module load is cheap and keeps the import machinery off the download
+# path. Never import app.worker.transcribe/download/subtitles here -- those
+# pull faster-whisper and yt-dlp into the API process.
+from app.worker.formats import iter_json, iter_srt, iter_txt, iter_vtt
+from app.worker.segments import segments_from_rows
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# WHY: Serializer for the list endpoint built once at import. Dumping
+# pre-constructed models through it runs entirely in pydantic-core and
+# skips FastAPI's per-request response_model validation pass.
+_job_list_adapter = TypeAdapter(list[JobListResponse])
+
+
+# WHY: Download formats mapped to (iterator, content type, filename), built
+# once at import instead of per request. Content-type mapping ensures
+# browsers and tools handle the downloaded file correctly. text/plain for
+# SRT/VTT is intentional to allow in-browser preview; attachment header
+# triggers download.
+_FORMAT_HANDLERS = {
+    "srt": (iter_srt, "text/srt", "transcript.srt"),
+    "vtt": (iter_vtt, "text/vtt", "transcript.vtt"),
+    "txt": (iter_txt, "text/plain", "transcript.txt"),
+    "json": (iter_json, "application/json", "transcript.json"),
+}
+_INVALID_FORMAT_DETAIL = "Invalid format '{}'. Must be one of: " + ", ".join(
+    sorted(_FORMAT_HANDLERS)
+)
+
+
+# WHY: Only the columns JobListResponse exposes. Selecting them directly
+# returns plain rows instead of full ORM objects (no identity map entries,
+# no instance state), and keeps result_text out of the list query entirely.
+_LIST_COLUMNS = (
+    Job.id,
+    Job.url,
+    Job.status,
+    Job.title,
+    Job.progress,
+    Job.source,
+    Job.created_at,
+    Job.completed_at,
+)
+
+
+# WHY: The list query has no parameters, so the Select is built once at
+# import. Each poll then skips the statement builder and goes straight to
+# SQLAlchemy's compiled-statement cache, which is keyed on this statement.
+_LIST_JOBS_STMT = select(*_LIST_COLUMNS).order_by(Job.created_at.desc()).limit(50)
+
+
+def _to_list_response(row: Row) -> JobListResponse:
+    """Build a JobListResponse from a _LIST_COLUMNS row without validation.
+
+    WHY: Rows come from our own database, so re-validating every field of
+    up to 50 rows per poll is pure overhead. model_construct trusts the
+    values and only assigns them. Row keys match the schema field names.
+    """
+    return JobListResponse.model_construct(**row._mapping)
+
+
+def _to_job_response(job: Job) -> JobResponse:
+    """Build a JobResponse from a Job row without validation.
+
+    WHY: Same trusted-data shortcut as _to_list_response, for the detail
+    view the frontend polls while a job is running.
+    """
+    return JobResponse.model_construct(
+        id=job.id,
+        url=job.url,
+        status=job.status,
+        title=job.title,
+        language=job.language,
+        detected_language=job.detected_language,
+        duration_seconds=job.duration_seconds,
+        progress=job.progress,
+        result_text=job.result_text,
+        error=job.error,
+        source=job.source,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+    )
+
+
+def _uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    WHY: Job IDs are the primary key of the jobs table. Random UUIDv4 keys
+    land on random B-tree pages, so every insert touches a different page.
+    UUIDv7 puts a 48-bit millisecond timestamp in the high bits, so new keys
+    are appended near the end of the index, and IDs still sort by creation
+    time. The stdlib only gains uuid7() in Python 3.14, hence this helper.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a (12 bits)
+    value |= 0b10 << 62  # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)  # rand_b (62 bits)
+    return uuid.UUID(int=value)
+
 
 def _validate_url_not_private(url: str) -> None:
     """Block URLs that resolve to private/reserved IP addresses.
@@ -56,9 +165,63 @@ def _validate_url_not_private(url: str) -> None:
                 detail="URL resolves to a private network address",
             )
 
+
+def _json_response(request: Request, body: bytes) -> Response:
+    """Return body as JSON with an ETag, or 304 if the client already has it.
+
+    WHY: The frontend polls the list and the open job every few seconds and
+    most polls return exactly what the browser already holds. The ETag is a
+    hash of the body itself, so any change (status, progress, title, ...)
+    yields a new tag, and an unchanged poll costs a few header bytes instead
+    of the full payload. fetch() sends If-None-Match and replays its cached
+    body on 304 automatically; no-cache makes it revalidate every time.
+    """
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag (RFC 9110)."""
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _encode_chunks(parts: Iterable[str], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Group small text parts into ~64 KiB UTF-8 chunks for streaming.
+
+    WHY: The format iterators yield one entry (or JSON token) at a time.
+    Sending each as its own ASGI message would cost far more than it saves;
+    batching keeps the number of sends proportional to the output size.
+    """
+    buffer: list[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
 # WHY: Module-level Redis connection and queue are reused across requests
-# to avoid reconnecting on every call. RQ handles connection pooling internally.
-redis_conn = Redis.from_url(settings.redis_url)
+# to avoid reconnecting on every call. A bounded BlockingConnectionPool makes
+# concurrent submits wait briefly for a free connection instead of opening
+# unbounded new ones (or failing) under a burst of requests.
+redis_pool = BlockingConnectionPool.from_url(
+    get_settings().redis_url, max_connections=16, timeout=2
+)
+redis_conn = Redis(connection_pool=redis_pool)
 queue = Queue("tscribe", connection=redis_conn)
 
 
@@ -69,11 +232,12 @@ async def create_job(payload: JobCreate, db: AsyncSession = Depends(get_db)):
     WHY: The API immediately persists the job and returns a reference ID
     so the client can poll for status. Actual transcription runs async
     in the RQ worker to keep API response times fast (<100ms).
-    The UUID is generated server-side to guarantee uniqueness.
+    The UUID is generated server-side to guarantee uniqueness; it is a
+    time-ordered UUIDv7 so inserts append to the primary-key index.
     """
     _validate_url_not_private(str(payload.url))
 
-    job_id = str(uuid.uuid4())
+    job_id = str(_uuid7())
 
     job = Job(
         id=job_id,
@@ -89,27 +253,38 @@ async def create_job(payload: JobCreate, db: AsyncSession = Depends(get_db)):
     # WHY: Enqueue by string path to top-level module so RQ resolves it
     # reliably. worker_entry.process_job lazy-imports the actual task,
     # keeping the API process free of heavy deps (faster-whisper, yt-dlp).
-    queue.enqueue("worker_entry.process_job", job.id, job_timeout=settings.job_timeout_seconds)
+    # RQ is synchronous, so the Redis round-trip runs in a worker thread
+    # to keep the event loop serving other requests meanwhile.
+    await asyncio.to_thread(
+        queue.enqueue,
+        "worker_entry.process_job",
+        job.id,
+        job_timeout=get_settings().job_timeout_seconds,
+    )
 
     return job
 
 
 @router.get("/", response_model=list[JobListResponse])
-async def list_jobs(db: AsyncSession = Depends(get_db)):
+async def list_jobs(request: Request, db: AsyncSession = Depends(get_db)):
     """Return recent jobs ordered by creation time.
 
     WHY: Limited to 50 rows to keep the response snappy and prevent
     accidental full-table dumps. Newest first because users care most
     about their latest submissions. Uses JobListResponse which excludes
     result_text to keep the payload lightweight for list views.
+    Returning a Response directly keeps response_model for the OpenAPI
+    docs while skipping its validation of our own trusted rows.
     """
-    stmt = select(Job).order_by(Job.created_at.desc()).limit(50)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    result = await db.execute(_LIST_JOBS_STMT)
+    jobs = [_to_list_response(row) for row in result]
+    return _json_response(request, _job_list_adapter.dump_json(jobs))
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+async def get_job(
+    job_id: uuid.UUID, request: Request, db: AsyncSession = Depends(get_db)
+):
     """Fetch a single job with full details including transcript text.
 
     WHY: Separating the detail view from the list view allows including
@@ -120,7 +295,7 @@ async def get_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     job = await db.get(Job, str(job_id))
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return _json_response(request, _to_job_response(job).model_dump_json().encode())
 
 
 @router.delete("/{job_id}", status_code=204)
@@ -140,10 +315,12 @@ async def delete_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     # WHY: Remove associated files before the DB record to prevent orphaned
     # directories from accumulating on disk. If file deletion fails, we log
     # a warning but still proceed with DB deletion so the job is not stuck.
-    job_dir = settings.data_dir / str(job_id)
+    # rmtree runs in a worker thread: unlinking a large audio directory can
+    # take seconds and would otherwise stall every other request on the loop.
+    job_dir = get_settings().data_dir / str(job_id)
     if job_dir.is_dir():
         try:
-            shutil.rmtree(job_dir)
+            await asyncio.to_thread(shutil.rmtree, job_dir)
             logger.info("Deleted job directory: %s", job_dir)
         except OSError:
             logger.warning("Failed to delete job directory: %s", job_dir, exc_info=True)
@@ -166,47 +343,36 @@ async def download_transcript(
     formats without re-processing.
     The job_id is typed as uuid.UUID so FastAPI returns 422 for malformed IDs.
     """
-    valid_formats = {"srt", "vtt", "txt", "json"}
-    if fmt not in valid_formats:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid format '{fmt}'. Must be one of: {', '.join(sorted(valid_formats))}",
-        )
+    format_handler = _FORMAT_HANDLERS.get(fmt)
+    if format_handler is None:
+        raise HTTPException(status_code=400, detail=_INVALID_FORMAT_DETAIL.format(fmt))
 
-    job = await db.get(Job, str(job_id))
+    # WHY: result_segments_json is deferred on the model (other endpoints
+    # never need it), so explicitly load it in the same SELECT here.
+    job = await db.get(Job, str(job_id), options=[undefer(Job.result_segments_json)])
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     if job.status != JobStatus.DONE:
         raise HTTPException(
             status_code=409,
-            detail="Transcript not yet available. Job status: " + job.status.value,
+            detail="Transcript not yet available. Job status: " + job.status,
         )
 
-    # WHY: Import format functions lazily to avoid loading worker
-    # dependencies (faster-whisper, etc.) in the API process. Only the
-    # lightweight format converters are needed here.
-    from app.worker.formats import to_json, to_srt, to_txt, to_vtt
-    from app.worker.transcribe import Segment
-
-    raw_segments = json.loads(job.result_segments_json) if job.result_segments_json else []
-    segments = [Segment(**s) for s in raw_segments]
-
-    # WHY: Content-type mapping ensures browsers and tools handle the
-    # downloaded file correctly. text/plain for SRT/VTT is intentional
-    # to allow in-browser preview; attachment header triggers download.
-    format_handlers = {
-        "srt": (to_srt, "text/srt", "transcript.srt"),
-        "vtt": (to_vtt, "text/vtt", "transcript.vtt"),
-        "txt": (to_txt, "text/plain", "transcript.txt"),
-        "json": (to_json, "application/json", "transcript.json"),
-    }
-
-    handler, content_type, filename = format_handlers[fmt]
-    content = handler(segments)
-
-    return Response(
-        content=content,
+    # WHY: orjson parses the stored segments several times faster than the
+    # stdlib json module; this is the largest payload the API decodes.
+    raw_segments = orjson.loads(job.result_segments_json) if job.result_segments_json else []
+    segments = segments_from_rows(raw_segments)
+
+    handler, content_type, filename = format_handler
+
+    # WHY: Stream the formatted transcript instead of building the whole
+    # document first. Peak memory no longer grows with a second full copy
+    # of the transcript, and the client receives the first bytes before
+    # the last segment is formatted.
+    return StreamingResponse(
+        _encode_chunks(handler(segments)),
         media_type=content_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+
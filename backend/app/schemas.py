@@ -7,10 +7,15 @@ WHY: Separate schemas from SQLAlchemy models because:
 """
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, HttpUrl
 
-from app.models import JobStatus
+# WHY: Literal over the JobStatus values (not the enum type) because job rows
+# carry plain strings (see Job.status). Serializes them without coercion and
+# still documents the allowed values in the OpenAPI schema. Keep in sync
+# with app.models.JobStatus.
+JobStatusValue = Literal["queued", "downloading", "transcribing", "done", "failed"]
 
 
 class JobCreate(BaseModel):
@@ -35,7 +40,7 @@ class JobResponse(BaseModel):
 
     id: str
     url: str
-    status: JobStatus
+    status: JobStatusValue
     title: str | None = None
     language: str | None = None
     detected_language: str | None = None
@@ -59,7 +64,7 @@ class JobListResponse(BaseModel):
 
     id: str
     url: str
-    status: JobStatus
+    status: JobStatusValue
     title: str | None = None
     progress: int = 0
     source: str | None = None
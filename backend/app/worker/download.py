@@ -13,7 +13,15 @@ from pathlib import Path
 
 import yt_dlp
 
-from app.config import settings
+from app.config import get_settings
+
+
+# WHY: Per-job cookie jar shared by the subtitle probe and the audio
+# download. Cookies the platform sets during the probe (consent, visitor
+# id) are sent on the download instead of being renegotiated. It lives in
+# the job directory, so concurrent workers never write the same file and
+# it is removed with the job's other files.
+COOKIE_FILE_NAME = "cookies.txt"
 
 
 @dataclass(frozen=True)
@@ -27,7 +35,10 @@ class DownloadResult:
 
     path: Path
     title: str
-    duration: float
+    # WHY: Whole milliseconds as reported by yt-dlp (0 if unknown). An int
+    # keeps comparisons exact; callers convert to seconds where they store
+    # or divide by it.
+    duration_ms: int
 
 
 def extract_audio(url: str, job_id: str) -> DownloadResult:
@@ -47,7 +58,7 @@ def extract_audio(url: str, job_id: str) -> DownloadResult:
     Raises:
         yt_dlp.utils.DownloadError: If the URL is invalid or download fails.
     """
-    output_dir = settings.data_dir / job_id
+    output_dir = get_settings().data_dir / job_id
     output_dir.mkdir(parents=True, exist_ok=True)
 
     ydl_opts = {
@@ -58,6 +69,16 @@ def extract_audio(url: str, job_id: str) -> DownloadResult:
         # format natively. Skipping WAV re-encoding saves minutes of CPU time
         # and ~600MB of disk per hour of audio.
         "outtmpl": str(output_dir / "audio.%(ext)s"),
+        "cookiefile": str(output_dir / COOKIE_FILE_NAME),
+        # WHY: HLS/DASH audio is often hundreds of short fragments; fetching
+        # several at once hides the per-fragment round trip that otherwise
+        # dominates the download. Non-fragmented formats are unaffected.
+        "concurrent_fragment_downloads": 8,
+        # WHY: Request large single files in 10 MiB ranges. Some hosts
+        # (notably YouTube) throttle long-running single responses.
+        "http_chunk_size": 10 * 1024 * 1024,
+        "retries": 3,
+        "fragment_retries": 3,
         # WHY: Suppress yt-dlp console output in worker logs.
         "quiet": True,
         "no_warnings": True,
@@ -65,18 +86,34 @@ def extract_audio(url: str, job_id: str) -> DownloadResult:
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         info = ydl.extract_info(url, download=True)
+        # WHY: Without the WAV postprocessor, the file extension depends on
+        # what the source provides (webm, m4a, opus, etc.). yt-dlp records
+        # the final path in the info dict, so read it from there instead of
+        # scanning the directory for audio.* (which could also pick up a
+        # stray .part file).
+        output_path = _downloaded_path(ydl, info)
 
     title = info.get("title", "Unknown")
-    duration = float(info.get("duration", 0.0))
+    # WHY: `or 0` also covers duration=None, which yt-dlp reports for live
+    # streams and some extractors (the key exists but has no value).
+    duration_ms = round((info.get("duration") or 0) * 1000)
 
-    # WHY: Without the WAV postprocessor, the file extension depends on what
-    # the source provides (webm, m4a, opus, etc.). We glob for the actual
-    # file instead of hardcoding an extension.
-    audio_files = list(output_dir.glob("audio.*"))
-    if not audio_files:
+    if not output_path.is_file():
         raise FileNotFoundError(
             f"yt-dlp did not produce an audio file in {output_dir}"
         )
-    output_path = audio_files[0]
 
-    return DownloadResult(path=output_path, title=title, duration=duration)
+    return DownloadResult(path=output_path, title=title, duration_ms=duration_ms)
+
+
+def _downloaded_path(ydl: yt_dlp.YoutubeDL, info: dict) -> Path:
+    """Return the path yt-dlp wrote the media to.
+
+    WHY: requested_downloads[0]["filepath"] is the final on-disk path after
+    any postprocessing. Older yt-dlp builds or unusual extractors may not set
+    it; prepare_filename rebuilds the same path from outtmpl in that case.
+    """
+    downloads = info.get("requested_downloads") or []
+    if downloads and downloads[0].get("filepath"):
+        return Path(downloads[0]["filepath"])
+    return Path(ydl.prepare_filename(info))
@@ -0,0 +1,69 @@
+"""Transcript data types shared by the worker and the API.
+
+WHY: Kept free of heavy imports (no faster-whisper, no yt-dlp) so the API
+process can use the same types and format converters as the worker without
+loading the Whisper runtime. transcribe.py re-exports both classes for
+existing imports.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Segment:
+    """A single transcription segment with timing information.
+
+    WHY: Typed segment data enables format conversion (SRT/VTT/JSON)
+    and frontend timestamp navigation. Frozen because transcription
+    results are immutable facts. slots=True drops the per-instance
+    __dict__; an hour of audio yields thousands of segments.
+    """
+
+    start: float
+    end: float
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptionResult:
+    """Complete transcription output from faster-whisper.
+
+    WHY: Bundles segments with detected language so callers get everything
+    they need in one return value. Language detection is useful for the
+    frontend to display and for future multi-language support.
+    """
+
+    segments: list[Segment] = field(default_factory=list)
+    language: str = "unknown"
+
+
+def segments_to_storage(
+    segments: Iterable[Segment],
+) -> tuple[str, list[tuple[float, float, str]]]:
+    """Split segments into (plain text, positional rows) in a single pass.
+
+    WHY: The worker stores both the newline-joined transcript (result_text)
+    and the segment rows (result_segments_json). Building both in one loop
+    walks a long transcript once instead of once per output.
+    Rows use the positional (start, end, text) layout: one short array per
+    segment instead of an object with repeated "start"/"end"/"text" keys,
+    which cuts the stored JSON by roughly a third.
+    """
+    texts: list[str] = []
+    rows: list[tuple[float, float, str]] = []
+    for seg in segments:
+        texts.append(seg.text)
+        rows.append((seg.start, seg.end, seg.text))
+    return "\n".join(texts), rows
+
+
+def segments_from_rows(rows: Iterable[list | dict]) -> list[Segment]:
+    """Rebuild Segments from decoded result_segments_json rows.
+
+    WHY: Jobs completed before the positional layout was introduced still
+    hold {"start", "end", "text"} objects, so both shapes are accepted.
+    """
+    return [
+        Segment(*row) if isinstance(row, list) else Segment(**row) for row in rows
+    ]
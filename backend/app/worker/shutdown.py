@@ -4,21 +4,24 @@ WHY: Docker sends SIGTERM on `docker stop`, then SIGKILL after the grace period
 (default 10s). Transcription jobs can run for minutes/hours, so the worker will
 get SIGKILL mid-transcription and leave the job stuck in TRANSCRIBING forever.
 
-Solution: A shared flag that the signal handler sets and the transcription loop
+Solution: A shared event that the signal handler sets and the transcription loop
 checks between segments. This lets the existing except-block in process_job()
 mark the job as FAILED instead of leaving it in a zombie state.
 """
 
 import logging
+import threading
 
 from rq import Worker
 
 logger = logging.getLogger(__name__)
 
-# WHY: Module-level flag checked by the transcription segment loop.
-# Threading is not involved (RQ workers are single-process), but the flag
-# must be accessible from both the signal handler and the transcription code.
-_shutdown_requested: bool = False
+# WHY: Module-level event checked by the transcription segment loop. It must
+# be reachable from both the signal handler and the transcription code; an
+# Event also lets future code block on it with wait(timeout=...).
+# It is per process: only code in the process whose request_stop ran sees
+# it set. A work horse forked before the signal keeps its own, unset copy.
+SHUTDOWN_EVENT = threading.Event()
 
 
 class ShutdownInterrupt(Exception):
@@ -37,14 +40,14 @@ def check_shutdown() -> None:
     cancellation point -- the transcription loop yields control here,
     allowing a clean exit instead of being SIGKILL'd mid-computation.
     """
-    if _shutdown_requested:
+    if SHUTDOWN_EVENT.is_set():
         raise ShutdownInterrupt(
             "Worker received SIGTERM -- shutting down gracefully"
         )
 
 
 class GracefulWorker(Worker):
-    """RQ Worker subclass that sets the shutdown flag on SIGTERM.
+    """RQ Worker subclass that sets the shutdown event on SIGTERM.
 
     WHY: RQ's Worker.work() calls self._install_signal_handlers() which
     overwrites any previously installed signal handlers. Subclassing and
@@ -53,19 +56,18 @@ class GracefulWorker(Worker):
 
     RQ's default request_stop() sets _stop_requested=True and waits for the
     current job to finish. For short jobs that works fine, but transcription
-    jobs can run for hours. Our override additionally sets the shutdown flag,
+    jobs can run for hours. Our override additionally sets SHUTDOWN_EVENT,
     which the transcription loop checks between segments and raises
     ShutdownInterrupt to fail the job cleanly.
     """
 
     def request_stop(self, signum, frame) -> None:
-        """Handle SIGTERM: set our flag, then delegate to RQ's default."""
-        global _shutdown_requested
+        """Handle SIGTERM: set our event, then delegate to RQ's default."""
         logger.warning(
             "SIGTERM received -- requesting graceful shutdown. "
             "Current job (if any) will be marked as FAILED."
         )
-        _shutdown_requested = True
+        SHUTDOWN_EVENT.set()
         # WHY: Still call RQ's default handler so the worker loop also knows
         # to stop after the (now quickly-failing) job completes. Without this,
         # the worker would pick up the next job from the queue after the
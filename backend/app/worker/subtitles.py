@@ -6,14 +6,27 @@ and running Whisper takes ~5 minutes on CPU. By trying subtitles first, we
 can skip the expensive transcription pipeline entirely for most YouTube videos.
 """
 
+import hashlib
 import json
 import logging
+import os
 import re
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
+from pathlib import Path
 
+import orjson
 import yt_dlp
 
-from app.worker.transcribe import Segment, TranscriptionResult
+from app.config import get_settings
+from app.worker.cleanup import SUBTITLE_CACHE_DIR_NAME
+from app.worker.segments import (
+    Segment,
+    TranscriptionResult,
+    segments_from_rows,
+    segments_to_storage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +34,23 @@ logger = logging.getLogger(__name__)
 # primary user base is German-speaking, English as common fallback.
 _DEFAULT_LANGUAGES = ["de", "en"]
 
+# WHY: Match VTT timestamp lines like "00:00:01.500 --> 00:00:04.200"
+# (optionally followed by cue settings) anywhere in the document. The
+# hours part is optional in VTT (MM:SS.mmm is valid). [^\S\n] is
+# "whitespace except newline" so a match never spans two lines.
+_VTT_TIMESTAMP_RE = re.compile(
+    r"^[^\S\n]*(?:(\d{1,2}):)?(\d{2}):(\d{2})[.,](\d{3})[^\S\n]*-->[^\S\n]*"
+    r"(?:(\d{1,2}):)?(\d{2}):(\d{2})[.,](\d{3})[^\n]*$",
+    re.MULTILINE,
+)
+_VTT_TAG_RE = re.compile(r"<[^>]+>")
+
+# WHY: Parsed subtitle tracks are cached on disk under data_dir so the same
+# video submitted again (by another user, or retried) skips the subtitle
+# download and parse. Disk rather than memory because RQ runs every job in
+# a freshly forked work horse, so in-process state does not survive jobs.
+# Expired entries are removed by cleanup_old_files.
+
 
 @dataclass(frozen=True)
 class SubtitleInfo:
@@ -53,36 +83,35 @@ def _select_subtitle_key(
       6. Any auto-generated sub
     Returns (language_key, is_auto) or None if no subtitles exist.
     """
-    # WHY: Build ordered list of (source_dict, is_auto) to search through.
-    # Manual subtitles are preferred because they are human-verified.
-    sources = [
-        (subtitles, False),
-        (auto_captions, True),
-    ]
-
-    # Priority 1-2: Requested language (manual then auto)
-    if language:
-        for source, is_auto in sources:
-            if language in source:
-                return (language, is_auto)
-
-    # Priority 3-4: Default languages (manual then auto for each lang)
-    for lang in _DEFAULT_LANGUAGES:
-        for source, is_auto in sources:
-            if lang in source:
-                return (lang, is_auto)
-
-    # Priority 5: Any manual subtitle
-    if subtitles:
-        first_key = next(iter(subtitles))
-        return (first_key, False)
+    return next(_subtitle_candidates(subtitles, auto_captions, language), None)
 
-    # Priority 6: Any auto-generated subtitle
-    if auto_captions:
-        first_key = next(iter(auto_captions))
-        return (first_key, True)
 
-    return None
+def _subtitle_candidates(
+    subtitles: dict,
+    auto_captions: dict,
+    language: str | None,
+) -> Iterator[tuple[str, bool]]:
+    """Yield available (language_key, is_auto) tracks in priority order.
+
+    WHY: Expressing the cascade as one generator lets _select_subtitle_key
+    take the first hit with next() instead of a chain of early returns.
+    Manual subtitles come before auto captions for each language because
+    they are human-verified.
+    """
+    # Priority 1-4: requested language, then default languages
+    for lang in (language, *_DEFAULT_LANGUAGES):
+        if not lang:
+            continue
+        if lang in subtitles:
+            yield (lang, False)
+        if lang in auto_captions:
+            yield (lang, True)
+
+    # Priority 5-6: Any manual subtitle, then any auto-generated subtitle
+    if subtitles:
+        yield (next(iter(subtitles)), False)
+    if auto_captions:
+        yield (next(iter(auto_captions)), True)
 
 
 def _find_json3_url(formats: list[dict]) -> str | None:
@@ -107,9 +136,11 @@ def _parse_json3_subtitles(data: dict) -> list[Segment]:
     with float seconds, matching Whisper output exactly.
     """
     segments: list[Segment] = []
-    events = data.get("events", [])
+    # WHY: Local aliases for the per-event hot path; a long transcript has
+    # tens of thousands of events and fragments.
+    append = segments.append
 
-    for event in events:
+    for event in data.get("events", []):
         # WHY: Skip events without text segments (e.g., format metadata,
         # window positioning events that YouTube includes in json3).
         segs = event.get("segs")
@@ -119,23 +150,20 @@ def _parse_json3_subtitles(data: dict) -> list[Segment]:
         # WHY: Combine all text fragments within one event into a single
         # segment. YouTube splits words into separate segs within an event,
         # but our Segment model expects one text string per timed block.
-        text_parts = []
-        for s in segs:
-            text = s.get("utf8", "").strip()
-            if text and text != "\n":
-                text_parts.append(text)
-
-        combined_text = " ".join(text_parts).strip()
+        combined_text = " ".join(
+            [text for s in segs if (text := s.get("utf8", "").strip())]
+        )
         if not combined_text:
             continue
 
         start_ms = event.get("tStartMs", 0)
-        duration_ms = event.get("dDurationMs", 0)
-
-        start = start_ms / 1000.0
-        end = (start_ms + duration_ms) / 1000.0
-
-        segments.append(Segment(start=start, end=end, text=combined_text))
+        append(
+            Segment(
+                start=start_ms / 1000.0,
+                end=(start_ms + event.get("dDurationMs", 0)) / 1000.0,
+                text=combined_text,
+            )
+        )
 
     return segments
 
@@ -149,49 +177,42 @@ def _parse_vtt_subtitles(vtt_content: str) -> list[Segment]:
     """
     segments: list[Segment] = []
 
-    # WHY: Match VTT timestamp lines like "00:00:01.500 --> 00:00:04.200"
-    # The hours part is optional in VTT (MM:SS.mmm is valid).
-    timestamp_re = re.compile(
-        r"(\d{1,2}:)?(\d{2}):(\d{2})[.,](\d{3})\s*-->\s*"
-        r"(\d{1,2}:)?(\d{2}):(\d{2})[.,](\d{3})"
-    )
-
-    lines = vtt_content.strip().split("\n")
-    i = 0
-    while i < len(lines):
-        match = timestamp_re.match(lines[i].strip())
-        if match:
-            groups = match.groups()
-            # WHY: Parse start timestamp, handling optional hours.
-            start_h = int(groups[0].rstrip(":")) if groups[0] else 0
-            start_m = int(groups[1])
-            start_s = int(groups[2])
-            start_ms = int(groups[3])
-            start = start_h * 3600 + start_m * 60 + start_s + start_ms / 1000.0
-
-            # WHY: Parse end timestamp with same optional-hours logic.
-            end_h = int(groups[4].rstrip(":")) if groups[4] else 0
-            end_m = int(groups[5])
-            end_s = int(groups[6])
-            end_ms = int(groups[7])
-            end = end_h * 3600 + end_m * 60 + end_s + end_ms / 1000.0
-
-            # WHY: Collect all text lines until blank line or next timestamp.
-            # VTT allows multi-line cue text.
-            i += 1
-            text_lines = []
-            while i < len(lines) and lines[i].strip() and not timestamp_re.match(lines[i].strip()):
-                # WHY: Strip VTT formatting tags like <c>, </c>, <b>, etc.
-                clean = re.sub(r"<[^>]+>", "", lines[i].strip())
-                if clean:
-                    text_lines.append(clean)
-                i += 1
-
-            text = " ".join(text_lines).strip()
-            if text:
-                segments.append(Segment(start=start, end=end, text=text))
-        else:
-            i += 1
+    # WHY: One finditer pass over the whole document finds every timing
+    # line; the cue text is the slice up to the next timing line. This
+    # replaces splitting the file into a line list and re-running the
+    # regex on every line to find where each cue ends.
+    matches = list(_VTT_TIMESTAMP_RE.finditer(vtt_content))
+    for idx, match in enumerate(matches):
+        groups = match.groups()
+        # WHY: Parse start timestamp, handling optional hours.
+        start_h = int(groups[0]) if groups[0] else 0
+        start = start_h * 3600 + int(groups[1]) * 60 + int(groups[2]) + int(groups[3]) / 1000.0
+
+        # WHY: Parse end timestamp with same optional-hours logic.
+        end_h = int(groups[4]) if groups[4] else 0
+        end = end_h * 3600 + int(groups[5]) * 60 + int(groups[6]) + int(groups[7]) / 1000.0
+
+        # WHY: Collect all text lines until blank line or next timestamp.
+        # VTT allows multi-line cue text. The first split element is the
+        # (empty) remainder of the timing line itself.
+        cue_end = matches[idx + 1].start() if idx + 1 < len(matches) else len(vtt_content)
+        text_lines = []
+        for line in vtt_content[match.end():cue_end].split("\n")[1:]:
+            line = line.strip()
+            if not line:
+                break
+            # WHY: Strip VTT formatting tags like <c>, </c>, <b>, etc.
+            # Manual subtitles rarely carry tags; the substring test skips
+            # the regex call for those lines (~5x cheaper per line).
+            if "<" in line:
+                line = _VTT_TAG_RE.sub("", line)
+                if not line:
+                    continue
+            text_lines.append(line)
+
+        text = " ".join(text_lines).strip()
+        if text:
+            segments.append(Segment(start=start, end=end, text=text))
 
     return segments
 
@@ -199,6 +220,7 @@ def _parse_vtt_subtitles(vtt_content: str) -> list[Segment]:
 def fetch_subtitles(
     url: str,
     language: str | None = None,
+    cookiefile: Path | None = None,
 ) -> SubtitleInfo | None:
     """Try to fetch existing subtitles from a URL without downloading media.
 
@@ -210,6 +232,8 @@ def fetch_subtitles(
     Args:
         url: Media URL (YouTube, etc.) to check for subtitles.
         language: Preferred language code (e.g., "de", "en") or None.
+        cookiefile: Optional cookie jar to load and save, so a later
+                    download for the same job reuses the probe's cookies.
 
     Returns:
         SubtitleInfo with parsed segments and metadata, or None if no
@@ -225,10 +249,27 @@ def fetch_subtitles(
         "quiet": True,
         "no_warnings": True,
     }
+    if cookiefile is not None:
+        # WHY: yt-dlp saves the jar on close and needs the directory to exist.
+        cookiefile.parent.mkdir(parents=True, exist_ok=True)
+        ydl_opts["cookiefile"] = str(cookiefile)
+
+    # WHY: One YoutubeDL instance for the metadata probe and the subtitle
+    # download. Constructing it registers every extractor and builds the
+    # cookie jar and URL opener, which is a noticeable share of the
+    # few-seconds subtitle path; the follow-up urlopen() reuses all of it.
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        return _fetch_with(ydl, url, language)
+
 
+def _fetch_with(
+    ydl: yt_dlp.YoutubeDL,
+    url: str,
+    language: str | None,
+) -> SubtitleInfo | None:
+    """Probe metadata and download the chosen subtitle track with one ydl."""
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = ydl.extract_info(url, download=False)
     except Exception:
         # WHY: If metadata extraction fails (e.g., geo-blocked, private video),
         # return None so the caller falls back to the full download pipeline.
@@ -240,7 +281,7 @@ def fetch_subtitles(
         return None
 
     title = info.get("title", "Unknown")
-    duration = float(info.get("duration", 0.0))
+    duration = float(info.get("duration") or 0.0)
     subtitles = info.get("subtitles") or {}
     auto_captions = info.get("automatic_captions") or {}
 
@@ -261,13 +302,22 @@ def fetch_subtitles(
         url,
     )
 
-    # WHY: Try json3 first (easiest to parse), then fall back to VTT download.
-    json3_url = _find_json3_url(formats)
+    cache_file = _cache_file(info, lang_key, is_auto)
+    segments = _load_cached(cache_file) if cache_file else None
 
-    if json3_url:
-        segments = _fetch_and_parse_json3(json3_url)
+    if segments is not None:
+        logger.info("Subtitle fetch: using cached '%s' track for %s", lang_key, url)
     else:
-        segments = _fetch_and_parse_vtt(formats)
+        # WHY: Try json3 first (easiest to parse), then fall back to VTT download.
+        json3_url = _find_json3_url(formats)
+
+        if json3_url:
+            segments = _fetch_and_parse_json3(ydl, json3_url)
+        else:
+            segments = _fetch_and_parse_vtt(ydl, formats)
+
+        if segments and cache_file:
+            _store_cached(cache_file, segments)
 
     if not segments:
         logger.info("Subtitle fetch: parsing yielded no segments for %s", url)
@@ -282,7 +332,56 @@ def fetch_subtitles(
     )
 
 
-def _fetch_and_parse_json3(json3_url: str) -> list[Segment]:
+def _cache_file(info: dict, lang_key: str, is_auto: bool) -> Path | None:
+    """Return the cache path for one subtitle track, or None if uncacheable.
+
+    WHY: Keyed on the extractor and its canonical video id (not the URL),
+    so youtu.be, watch?v= and playlist URLs of the same video share an
+    entry. Manual and auto-generated tracks are cached separately.
+    """
+    video_id = info.get("id")
+    if not video_id:
+        return None
+    extractor = info.get("extractor_key") or info.get("extractor") or ""
+    kind = "auto" if is_auto else "manual"
+    key = f"{extractor}:{video_id}:{lang_key}:{kind}"
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return get_settings().data_dir / SUBTITLE_CACHE_DIR_NAME / f"{digest}.json"
+
+
+def _load_cached(path: Path) -> list[Segment] | None:
+    """Read a cached track, ignoring entries older than the cleanup age.
+
+    WHY: Auto-generated captions can be regenerated by the platform, so a
+    cached track is only trusted for cleanup_max_age_hours. Any read or
+    decode error is treated as a miss.
+    """
+    max_age_seconds = get_settings().cleanup_max_age_hours * 3600
+    try:
+        if time.time() - path.stat().st_mtime > max_age_seconds:
+            return None
+        return segments_from_rows(orjson.loads(path.read_bytes()))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached(path: Path, segments: list[Segment]) -> None:
+    """Write a parsed track to the cache; failures only cost the cache entry.
+
+    WHY: Written to a temp file and renamed so a concurrent reader never
+    sees a half-written entry.
+    """
+    _, rows = segments_to_storage(segments)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(rows))
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("Subtitle fetch: could not write cache entry %s", path, exc_info=True)
+
+
+def _fetch_and_parse_json3(ydl: yt_dlp.YoutubeDL, json3_url: str) -> list[Segment]:
     """Download and parse a json3 subtitle URL.
 
     WHY: json3 is YouTube's native structured subtitle format. Downloading
@@ -292,10 +391,8 @@ def _fetch_and_parse_json3(json3_url: str) -> list[Segment]:
     try:
         # WHY: Use yt-dlp's built-in downloader to handle authentication
         # cookies and headers that may be needed for the subtitle URL.
-        ydl_opts = {"quiet": True, "no_warnings": True}
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            response = ydl.urlopen(json3_url)
-            data = json.loads(response.read().decode("utf-8"))
+        response = ydl.urlopen(json3_url)
+        data = json.loads(response.read().decode("utf-8"))
 
         return _parse_json3_subtitles(data)
     except Exception:
@@ -303,7 +400,7 @@ def _fetch_and_parse_json3(json3_url: str) -> list[Segment]:
         return []
 
 
-def _fetch_and_parse_vtt(formats: list[dict]) -> list[Segment]:
+def _fetch_and_parse_vtt(ydl: yt_dlp.YoutubeDL, formats: list[dict]) -> list[Segment]:
     """Download and parse a VTT subtitle from available formats.
 
     WHY: Fallback when json3 is not available. VTT is the most common
@@ -325,10 +422,8 @@ def _fetch_and_parse_vtt(formats: list[dict]) -> list[Segment]:
         return []
 
     try:
-        ydl_opts = {"quiet": True, "no_warnings": True}
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            response = ydl.urlopen(vtt_url)
-            content = response.read().decode("utf-8")
+        response = ydl.urlopen(vtt_url)
+        content = response.read().decode("utf-8")
 
         return _parse_vtt_subtitles(content)
     except Exception:
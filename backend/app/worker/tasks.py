@@ -6,48 +6,69 @@ from blocking HTTP request handling. Each task function is the unit of work
 that RQ serializes and dispatches to a worker.
 """
 
-import json
 import logging
 import shutil
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event, update
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from app.config import settings
+from app.config import get_settings
+from app.database import set_sqlite_pragmas
 from app.models import Job, JobStatus
-from app.worker.cleanup import cleanup_old_files
-from app.worker.download import extract_audio
+from app.worker.cleanup import cleanup_if_due
+from app.worker.download import COOKIE_FILE_NAME, extract_audio
+from app.worker.segments import Segment, segments_to_storage
 from app.worker.subtitles import fetch_subtitles
-from app.worker.transcribe import transcribe_audio
+from app.worker.transcribe import preload_model, transcribe_audio
 
 logger = logging.getLogger(__name__)
 
 # WHY: Sync SQLAlchemy engine for the worker process. RQ workers are
 # synchronous (no asyncio event loop), so we cannot use the async engine
-# from database.py. We derive the sync URL from the configured async URL
-# by stripping the "+aiosqlite" dialect suffix.
-_sync_db_url = settings.database_url.replace("+aiosqlite", "")
+# from database.py. Settings.sync_database_url swaps the async driver in the
+# configured URL for its sync counterpart.
+# WHY StaticPool: A job runs on one thread and writes through one session,
+# so a single persistent sqlite3 connection is all the worker ever needs.
+# The default QueuePool adds checkout/return bookkeeping (and a reset
+# ROLLBACK) around every commit without any concurrency to show for it.
 sync_engine = create_engine(
-    _sync_db_url,
+    get_settings().sync_database_url,
     connect_args={"check_same_thread": False},
-    echo=settings.debug,
+    poolclass=StaticPool,
+    echo=get_settings().debug,
 )
+# WHY: Same WAL/synchronous=NORMAL tuning as the API engine. The worker is
+# the only writer, and every status/progress commit would otherwise pay a
+# full fsync in rollback-journal mode while blocking the API's readers.
+if sync_engine.dialect.name == "sqlite":
+    event.listen(sync_engine, "connect", set_sqlite_pragmas)
 
 
 def _update_job(session: Session, job_id: str, **kwargs) -> None:
     """Update job fields in a single commit.
 
-    WHY: Centralizes the get-update-commit pattern to avoid repetition
-    and ensure every status change is immediately committed (visible to
-    the API server reading from the same SQLite file).
+    WHY: Centralizes the update-commit pattern to avoid repetition and
+    ensure every status change is immediately committed (visible to the API
+    server reading from the same SQLite file). A Core UPDATE by primary key
+    is one statement per call, with no ORM load or dirty tracking, and it
+    does not depend on the Job row still being in the identity map (it is
+    not after the rollback in the failure path).
+    Transactions are deliberately one row, one commit: with WAL the API
+    keeps reading during the write, but a long transaction spanning a whole
+    phase would hold the write lock and stall API job submissions.
     """
-    job = session.get(Job, job_id)
-    if job is None:
+    result = session.execute(
+        update(Job).where(Job.id == job_id).values(**kwargs),
+        execution_options={"synchronize_session": False},
+    )
+    if result.rowcount == 0:
         raise ValueError(f"Job {job_id} not found in database")
-    for key, value in kwargs.items():
-        setattr(job, key, value)
     session.commit()
 
 
@@ -69,7 +90,12 @@ def process_job(job_id: str) -> None:
     Args:
         job_id: UUID of the job to process (must exist in database).
     """
-    with Session(sync_engine) as session:
+    # WHY: One session for the whole job instead of one per phase. Each
+    # phase still commits so the API sees the new status immediately, but
+    # the Job row is loaded once and the session is not rebuilt for every
+    # status or progress write. expire_on_commit=False keeps the loaded row
+    # usable across those commits without re-SELECTing it.
+    with Session(sync_engine, expire_on_commit=False) as session:
         # WHY: Load language preference before starting the pipeline.
         # This is the only field we need from the initial job record.
         job = session.get(Job, job_id)
@@ -79,6 +105,16 @@ def process_job(job_id: str) -> None:
         url = job.url
         language = job.language
 
+        _run_pipeline(session, job_id, url, language)
+
+
+def _run_pipeline(session: Session, job_id: str, url: str, language: str | None) -> None:
+    """Run the pipeline phases for one job on an already-open session.
+
+    WHY: Split out of process_job so the shared session's lifetime is the
+    with-block above and the phase logic keeps its original shape.
+    """
+    settings = get_settings()
     try:
         # Phase 0: Try fetching existing subtitles (seconds vs minutes)
         # WHY: Many platforms (YouTube etc.) already have auto-generated or manual
@@ -86,10 +122,11 @@ def process_job(job_id: str) -> None:
         # takes ~5 minutes on CPU. We try subtitles first and only fall back to
         # the full pipeline if no subtitles are available.
         logger.info("Job %s: checking for existing subtitles at %s", job_id, url)
-        with Session(sync_engine) as session:
-            _update_job(session, job_id, status=JobStatus.DOWNLOADING)
+        _update_job(session, job_id, status=JobStatus.DOWNLOADING)
 
-        subtitle_info = fetch_subtitles(url, language)
+        subtitle_info = fetch_subtitles(
+            url, language, cookiefile=settings.data_dir / job_id / COOKIE_FILE_NAME
+        )
 
         if subtitle_info is not None:
             # WHY: Subtitles found -- skip the entire download + transcription
@@ -101,32 +138,23 @@ def process_job(job_id: str) -> None:
                 subtitle_info.result.language,
             )
 
-            segments_data = [
-                {"start": seg.start, "end": seg.end, "text": seg.text}
-                for seg in subtitle_info.result.segments
-            ]
-            plain_text = "\n".join(
-                seg.text for seg in subtitle_info.result.segments
-            )
+            plain_text, segments_data = segments_to_storage(subtitle_info.result.segments)
 
-            with Session(sync_engine) as session:
-                _update_job(
-                    session,
-                    job_id,
-                    status=JobStatus.DONE,
-                    progress=100,
-                    title=subtitle_info.title,
-                    duration_seconds=subtitle_info.duration,
-                    result_text=plain_text,
-                    result_segments_json=json.dumps(
-                        segments_data, ensure_ascii=False
-                    ),
-                    detected_language=subtitle_info.result.language,
-                    completed_at=datetime.now(timezone.utc),
-                    # WHY: Track that this job used the fast subtitle path
-                    # so the frontend can show the transcription source.
-                    source="subtitles",
-                )
+            _update_job(
+                session,
+                job_id,
+                status=JobStatus.DONE,
+                progress=100,
+                title=subtitle_info.title,
+                duration_seconds=subtitle_info.duration,
+                result_text=plain_text,
+                result_segments_json=orjson.dumps(segments_data).decode(),
+                detected_language=subtitle_info.result.language,
+                completed_at=datetime.now(timezone.utc),
+                # WHY: Track that this job used the fast subtitle path
+                # so the frontend can show the transcription source.
+                source="subtitles",
+            )
 
             logger.info("Job %s: completed via subtitles (fast path)", job_id)
 
@@ -138,79 +166,59 @@ def process_job(job_id: str) -> None:
             # Phase 1: Download
             logger.info("Job %s: downloading audio from %s", job_id, url)
 
-            result = extract_audio(url, job_id)
+            # WHY: The download is network-bound and the Whisper model load
+            # (every job, see transcribe.py) is disk/CPU-bound and independent
+            # of the audio. Load the model in a helper thread while the
+            # download runs here, so the job does not pay both back to back.
+            # The download stays on the critical path: if it fails, the error
+            # propagates at once instead of waiting out a 5-30s model load.
+            pool = ThreadPoolExecutor(max_workers=1)
+            preload = pool.submit(preload_model)
+            try:
+                result = extract_audio(url, job_id)
+            finally:
+                pool.shutdown(wait=False)
+            try:
+                preload.result()
+            except Exception:
+                # WHY: transcribe_audio loads the model again and raises
+                # there if it really cannot be loaded, so a preload failure
+                # must not hide a successful download.
+                logger.warning("Job %s: model preload failed", job_id, exc_info=True)
 
             # Phase 2: Transcribe
             logger.info("Job %s: transcribing audio (%s)", job_id, result.title)
-            with Session(sync_engine) as session:
-                _update_job(
-                    session,
-                    job_id,
-                    status=JobStatus.TRANSCRIBING,
-                    title=result.title,
-                    duration_seconds=result.duration,
-                    # WHY: 5% signals download is done and transcription is starting.
-                    # Gives immediate visual feedback before the first segment arrives.
-                    progress=5,
-                )
-
-            # WHY: Build a progress callback that maps segment timestamps to
-            # percentage complete. Throttled to avoid excessive DB writes --
-            # only updates when progress changes by >= 5% or 30s have elapsed.
-            total_duration = result.duration
-            last_reported = {"pct": 5, "time": time.monotonic()}
-
-            def _on_segment(segment) -> None:
-                """Report transcription progress based on segment end timestamp."""
-                if total_duration <= 0:
-                    # WHY: If yt-dlp didn't provide duration (e.g., live streams),
-                    # we cannot calculate percentage -- skip progress updates.
-                    return
-
-                # WHY: Map segment.end to 5-95% range. The 5% floor accounts for
-                # the download phase; 95% ceiling reserves space for the final
-                # DB-write phase. This prevents the bar from jumping backwards
-                # or hitting 100% before the job is truly done.
-                raw_pct = int(segment.end / total_duration * 90) + 5
-                current_pct = min(raw_pct, 95)
-
-                pct_delta = current_pct - last_reported["pct"]
-                time_delta = time.monotonic() - last_reported["time"]
-
-                # WHY: Throttle DB writes to every 5% change or every 30 seconds.
-                # Without throttling, a 1-hour audio file generates ~3600 segments,
-                # each triggering a DB write -- far too many for SQLite.
-                if pct_delta >= 5 or (time_delta >= 30 and pct_delta >= 1):
-                    with Session(sync_engine) as session:
-                        _update_job(session, job_id, progress=current_pct)
-                    last_reported["pct"] = current_pct
-                    last_reported["time"] = time.monotonic()
-
-            transcription = transcribe_audio(result.path, language, on_segment=_on_segment)
+            _update_job(
+                session,
+                job_id,
+                status=JobStatus.TRANSCRIBING,
+                title=result.title,
+                duration_seconds=result.duration_ms / 1000,
+                # WHY: 5% signals download is done and transcription is starting.
+                # Gives immediate visual feedback before the first segment arrives.
+                progress=5,
+            )
+
+            on_segment = _progress_callback(session, job_id, result.duration_ms / 1000)
+
+            transcription = transcribe_audio(result.path, language, on_segment=on_segment)
 
             # Phase 3: Store results
-            segments_data = [
-                {"start": seg.start, "end": seg.end, "text": seg.text}
-                for seg in transcription.segments
-            ]
-            plain_text = "\n".join(seg.text for seg in transcription.segments)
-
-            with Session(sync_engine) as session:
-                _update_job(
-                    session,
-                    job_id,
-                    status=JobStatus.DONE,
-                    progress=100,
-                    result_text=plain_text,
-                    result_segments_json=json.dumps(
-                        segments_data, ensure_ascii=False
-                    ),
-                    detected_language=transcription.language,
-                    completed_at=datetime.now(timezone.utc),
-                    # WHY: Track that this job used the slow Whisper path
-                    # so the frontend can show the transcription source.
-                    source="whisper",
-                )
+            plain_text, segments_data = segments_to_storage(transcription.segments)
+
+            _update_job(
+                session,
+                job_id,
+                status=JobStatus.DONE,
+                progress=100,
+                result_text=plain_text,
+                result_segments_json=orjson.dumps(segments_data).decode(),
+                detected_language=transcription.language,
+                completed_at=datetime.now(timezone.utc),
+                # WHY: Track that this job used the slow Whisper path
+                # so the frontend can show the transcription source.
+                source="whisper",
+            )
 
             logger.info("Job %s: completed via Whisper transcription", job_id)
 
@@ -220,14 +228,16 @@ def process_job(job_id: str) -> None:
         # state with no error information for the user.
         logger.exception("Job %s: failed", job_id)
         error_msg = _format_error()
-        with Session(sync_engine) as session:
-            _update_job(
-                session,
-                job_id,
-                status=JobStatus.FAILED,
-                error=error_msg,
-                completed_at=datetime.now(timezone.utc),
-            )
+        # WHY: The failure may have happened mid-flush; roll back so the
+        # shared session is usable again before recording the error.
+        session.rollback()
+        _update_job(
+            session,
+            job_id,
+            status=JobStatus.FAILED,
+            error=error_msg,
+            completed_at=datetime.now(timezone.utc),
+        )
 
     finally:
         # WHY: Audio files can be tens of MB per hour of content. Without
@@ -239,17 +249,61 @@ def process_job(job_id: str) -> None:
             shutil.rmtree(job_dir, ignore_errors=True)
             logger.info("Job %s: cleaned up job directory", job_id)
 
-        # WHY: Run stale-file cleanup after every job as a simple alternative
-        # to a separate scheduler. This catches leftover directories from
-        # previous jobs that may have missed cleanup (e.g., worker killed).
+        # WHY: Run stale-file cleanup after jobs (at most every few minutes)
+        # as a simple alternative to a separate scheduler. This catches
+        # leftover directories from previous jobs that may have missed
+        # cleanup (e.g., worker killed).
         try:
-            removed = cleanup_old_files()
+            removed = cleanup_if_due()
             if removed:
                 logger.info("Cleanup: removed %d stale job directories", removed)
         except Exception:
             logger.warning("Cleanup: failed to remove stale files", exc_info=True)
 
 
+def _progress_callback(
+    session: Session, job_id: str, total_duration: float
+) -> Callable[[Segment], None] | None:
+    """Build the per-segment progress callback for transcribe_audio.
+
+    WHY: Maps segment timestamps to percentage complete. Throttled to avoid
+    excessive DB writes -- only updates when progress changes by >= 5% or
+    30s have elapsed. State lives in closure variables rather than a dict:
+    the callback runs once per segment (thousands per hour of audio) and
+    most calls return before even reading the clock.
+
+    Returns None if yt-dlp didn't provide a duration (e.g., live streams),
+    since a percentage cannot be calculated then.
+    """
+    if total_duration <= 0:
+        return None
+
+    last_pct = 5
+    deadline = time.monotonic() + 30
+
+    def _on_segment(segment: Segment) -> None:
+        """Report transcription progress based on segment end timestamp."""
+        nonlocal last_pct, deadline
+
+        # WHY: Map segment.end to 5-95% range. The 5% floor accounts for
+        # the download phase; 95% ceiling reserves space for the final
+        # DB-write phase. This prevents the bar from jumping backwards
+        # or hitting 100% before the job is truly done.
+        current_pct = min(int(segment.end / total_duration * 90) + 5, 95)
+        if current_pct <= last_pct:
+            return
+
+        # WHY: Throttle DB writes to every 5% change or every 30 seconds.
+        # Without throttling, a 1-hour audio file generates ~3600 segments,
+        # each triggering a DB write -- far too many for SQLite.
+        if current_pct - last_pct >= 5 or time.monotonic() >= deadline:
+            _update_job(session, job_id, progress=current_pct)
+            last_pct = current_pct
+            deadline = time.monotonic() + 30
+
+    return _on_segment
+
+
 def _format_error() -> str:
     """Format the current exception as a user-friendly error message.
 
@@ -9,77 +9,209 @@ RQ (Redis Queue) was chosen over Celery because:
 
 Usage:
     python run_worker.py
+
+Set TSCRIBE_WORKER_CONCURRENCY=N to run N worker processes in this container.
 """
 
 import logging
+import os
+import signal
 import sqlite3
 import sys
 
 from redis import Redis
 from rq import Queue
 
-from app.config import settings
+from app.config import get_settings
 from app.worker.shutdown import GracefulWorker
 
-# WHY: Configure logging before anything else so worker startup
-# messages and job processing logs are visible.
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    stream=sys.stdout,
-)
 logger = logging.getLogger("tscribe.worker")
 
+_WORKER_NAME = "tscribe-worker"
+
 
 def main() -> None:
-    """Start the RQ worker listening on the 'tscribe' queue.
+    """Start the RQ worker(s) listening on the 'tscribe' queue.
 
     WHY: Named queue ('tscribe') isolates our jobs from any other RQ
-    jobs sharing the same Redis instance. The worker blocks and processes
-    jobs sequentially, which is appropriate because transcription is
-    resource-intensive and parallel jobs would compete for CPU/GPU.
+    jobs sharing the same Redis instance. Each worker processes jobs
+    sequentially, which is appropriate because transcription is
+    resource-intensive; TSCRIBE_WORKER_CONCURRENCY opts into several
+    workers on hosts with enough cores.
     """
-    redis_conn = Redis.from_url(settings.redis_url)
-    queue = Queue("tscribe", connection=redis_conn)
+    _configure_logging()
 
+    settings = get_settings()
     logger.info(
-        "Starting TScribe worker (model=%s, device=%s, compute=%s)",
+        "Starting TScribe worker (model=%s, device=%s, compute=%s, concurrency=%d)",
         settings.whisper_model,
         settings.whisper_device,
         settings.whisper_compute_type,
+        settings.worker_concurrency,
+    )
+
+    # WHY: Create the data directory once here; per-job code then only
+    # creates its own job directory underneath it.
+    settings.data_dir.mkdir(parents=True, exist_ok=True)
+
+    _fail_orphaned_jobs()
+    _prewarm()
+
+    if settings.worker_concurrency <= 1:
+        _run_worker(_WORKER_NAME)
+    else:
+        _run_worker_pool(settings.worker_concurrency)
+
+
+def _configure_logging() -> None:
+    """Send log records to a line-buffered stdout.
+
+    WHY: Called first thing in main() (not at import) so startup messages
+    and job logs are visible, while tests can import this module without
+    reconfiguring pytest's captured stdout.
+    """
+    # WHY: Without a TTY (Docker) stdout is block-buffered. Logging flushes each
+    # record itself, but anything else written to stdout (library output) would
+    # sit in the buffer, show up late in `docker logs`, and be written twice if
+    # still buffered when the worker pool forks. Line buffering avoids all three.
+    sys.stdout.reconfigure(line_buffering=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stdout,
+    )
+
+
+def _fail_orphaned_jobs() -> None:
+    """Mark jobs left mid-pipeline by a killed worker as FAILED.
+
+    WHY: If the worker was killed (OOM, SIGKILL, power loss), jobs stuck in
+    DOWNLOADING or TRANSCRIBING status will never complete. Mark them as FAILED
+    on startup so the frontend shows the correct state and users can retry.
+    Runs once in the parent, before any worker can pick up a job.
+    """
+    db_path = get_settings().database_url.split("///", 1)[1]
+    conn = sqlite3.connect(db_path)
+    orphaned = conn.execute(
+        "UPDATE jobs SET status = 'failed', error = 'Worker was restarted during processing.'"
+        " WHERE status IN ('downloading', 'transcribing')"
     )
+    if orphaned.rowcount > 0:
+        logger.warning("Marked %d orphaned job(s) as failed", orphaned.rowcount)
+    conn.commit()
+    conn.close()
+
+
+def _prewarm() -> None:
+    """Import the job pipeline and build one YoutubeDL before taking jobs.
+
+    WHY: RQ forks a fresh work horse for every job, and worker_entry imports
+    the pipeline lazily inside that horse. Without this, every job re-paid
+    the import of yt-dlp, its extractor registry and faster-whisper (~1s+).
+    Doing it once here means each forked horse (and each pool worker)
+    inherits the loaded modules copy-on-write.
+    """
+    import yt_dlp
+
+    import app.worker.tasks  # noqa: F401 -- imported for its side effect
+
+    with yt_dlp.YoutubeDL({"quiet": True, "no_warnings": True}):
+        pass
+
+    # WHY: Deliberately no model load here. CTranslate2 starts its thread
+    # pool when a model loads, and threads do not survive fork(): a horse
+    # inheriting a loaded model can hang on its first transcribe (and a
+    # CUDA context cannot cross fork() at all). Each job loads the model
+    # in its own horse, overlapped with the audio download in process_job.
+
+
+def _run_worker(name: str) -> None:
+    """Run one GracefulWorker in the current process until it stops."""
+    redis_conn = Redis.from_url(get_settings().redis_url)
+    queue = Queue("tscribe", connection=redis_conn)
 
     # WHY: GracefulWorker subclasses RQ's Worker to hook into SIGTERM handling.
     # On SIGTERM it sets a shutdown flag that the transcription loop checks
     # between segments, causing the job to fail cleanly instead of being
     # SIGKILL'd by Docker after the grace period expires.
-    worker = GracefulWorker([queue], connection=redis_conn, name="tscribe-worker")
+    worker = GracefulWorker([queue], connection=redis_conn, name=name)
 
     # WHY: If the previous worker was killed (SIGKILL, OOM, power loss), its
     # registration key remains in Redis causing "active worker already exists".
     # Clean up the stale key before registering. Safe because this container
-    # is the only worker instance (single-replica Docker service).
+    # is the only worker instance (single-replica Docker service) and names
+    # are unique within it.
     stale_key = f"rq:worker:{worker.name}"
     if redis_conn.exists(stale_key):
         logger.warning("Cleaning up stale worker key: %s", stale_key)
         redis_conn.delete(stale_key)
 
-    # WHY: If the worker was killed (OOM, SIGKILL, power loss), jobs stuck in
-    # DOWNLOADING or TRANSCRIBING status will never complete. Mark them as FAILED
-    # on startup so the frontend shows the correct state and users can retry.
-    db_path = settings.database_url.split("///", 1)[1]
-    conn = sqlite3.connect(db_path)
-    orphaned = conn.execute(
-        "UPDATE jobs SET status = 'failed', error = 'Worker was restarted during processing.'"
-        " WHERE status IN ('downloading', 'transcribing')"
-    )
-    if orphaned.rowcount > 0:
-        logger.warning("Marked %d orphaned job(s) as failed", orphaned.rowcount)
-    conn.commit()
-    conn.close()
-
     worker.work(with_scheduler=False)
 
 
+def _run_worker_pool(count: int) -> None:
+    """Fork `count` worker processes and supervise them until they exit.
+
+    WHY: One RQ worker handles one job at a time, so on a many-core host a
+    single worker leaves most cores idle while it transcribes and leaves the
+    CPU idle while it downloads. Forked workers share nothing but the queue
+    and the SQLite file (WAL mode lets the API keep reading while they
+    write). The parent only forwards SIGTERM so every child runs its own
+    graceful shutdown, then waits for all of them.
+    """
+    children: list[int] = []
+    stopping = False
+
+    def _forward(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for child in children:
+            try:
+                os.kill(child, signum)
+            except ProcessLookupError:
+                pass
+
+    # WHY: Installed before the first fork, so a SIGTERM that arrives while
+    # the pool is starting is forwarded to the children that exist and stops
+    # further forks. SIGINT is ignored rather than forwarded: Ctrl-C reaches
+    # the whole foreground process group, so every child already gets it,
+    # and forwarding would deliver it twice.
+    signal.signal(signal.SIGTERM, _forward)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for index in range(1, count + 1):
+        if stopping:
+            break
+        pid = os.fork()
+        if pid == 0:
+            # WHY: The child inherited the parent's forwarding handler and
+            # ignored SIGINT; restore the defaults so RQ's Worker installs
+            # its own shutdown handlers on a clean slate.
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            # WHY: os._exit skips the parent's atexit handlers and buffered
+            # I/O that the child inherited but does not own. It also skips
+            # SystemExit handling, so the code is passed through by hand.
+            exit_code = 1
+            try:
+                _run_worker(f"{_WORKER_NAME}-{index}")
+                exit_code = 0
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    exit_code = exc.code or 0
+            except Exception:
+                logger.exception("Worker %d crashed", index)
+            finally:
+                logging.shutdown()
+                os._exit(exit_code)
+        children.append(pid)
+
+    exit_code = 0
+    for child in children:
+        _, status = os.waitpid(child, 0)
+        if os.waitstatus_to_exitcode(status) != 0:
+            exit_code = 1
+    sys.exit(exit_code)
+
 if __name__ == "__main__":
     main()
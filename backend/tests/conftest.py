@@ -3,54 +3,65 @@
 Provides:
 - In-memory async SQLite database (no file, no external DB needed)
 - FastAPI TestClient with overridden DB dependency
-- Mock Redis/RQ so tests run without a Redis server
+- Mock RQ queue so tests run without a Redis server
 - Segment factory for format converter tests
 """
 
 import sys
-from dataclasses import dataclass
-from unittest.mock import MagicMock, patch
+import uuid
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 # ---------------------------------------------------------------------------
 # Mock heavy worker dependencies BEFORE any app imports touch them.
 # faster-whisper is not installed in the test environment.
 # ---------------------------------------------------------------------------
 
+# WHY: The transcript types live in app.worker.segments, which has no heavy
+# imports, so tests use the real Segment. Only app.worker.transcribe is
+# faked, because importing it loads faster-whisper and CTranslate2; the
+# fake still exposes the real types for code that imports them from there.
+from app.worker.segments import Segment, TranscriptionResult  # noqa: E402
 
-@dataclass(frozen=True)
-class Segment:
-    """Test-compatible Segment matching app.worker.transcribe.Segment."""
-
-    start: float
-    end: float
-    text: str
-
-
-# Create a fake transcribe module so `from app.worker.transcribe import Segment` works
-# without faster-whisper being installed.
 _fake_transcribe = MagicMock()
 _fake_transcribe.Segment = Segment
+_fake_transcribe.TranscriptionResult = TranscriptionResult
 sys.modules.setdefault("faster_whisper", MagicMock())
 sys.modules.setdefault("app.worker.transcribe", _fake_transcribe)
 
-# Mock Redis and RQ at module level before importing the app.
-# The jobs router creates a Redis connection and RQ Queue at import time.
-_mock_redis_class = MagicMock()
+# WHY: The jobs router builds its Redis client and RQ Queue at import time,
+# but the client sits on a lazy connection pool, so importing the app never
+# touches Redis. Only enqueue has to be faked; see mock_queue below.
+from app.database import Base, get_db, set_sqlite_pragmas  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.models import Job  # noqa: E402
+from app.routes import jobs as jobs_routes  # noqa: E402
+
 _mock_queue_instance = MagicMock()
 _mock_queue_instance.enqueue = MagicMock(return_value=MagicMock(id="mock-rq-job-id"))
 
-with patch("redis.Redis.from_url", return_value=MagicMock()):
-    with patch("rq.Queue", return_value=_mock_queue_instance):
-        from app.database import Base, get_db
-        from app.main import create_app
 
-# Re-export Segment so test modules can import from conftest
-__all__ = ["Segment"]
+# ---------------------------------------------------------------------------
+# RQ queue mock
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_queue():
+    """Swap the jobs router's RQ queue for a mock once per test session.
+
+    WHY: Installed once instead of per client fixture; no test needs a
+    fresh mock, and nothing else in the session talks to Redis.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(jobs_routes, "queue", _mock_queue_instance)
+        yield _mock_queue_instance
 
 
 # ---------------------------------------------------------------------------
@@ -65,26 +76,78 @@ def anyio_backend():
     return "asyncio"
 
 
-@pytest_asyncio.fixture(scope="function")
-async def async_db_session():
-    """Yield a fresh async DB session backed by an in-memory SQLite database.
+def _begin_explicitly(conn) -> None:
+    """Emit BEGIN ourselves so SAVEPOINTs nest inside the test transaction.
 
-    Each test function gets its own database (tables created and dropped).
+    WHY: The sqlite3 driver starts and ends transactions on its own, which
+    breaks SAVEPOINT handling; this is SQLAlchemy's documented pysqlite
+    workaround, paired with isolation_level=None in _disable_autobegin.
     """
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    conn.exec_driver_sql("BEGIN")
+
+
+def _disable_autobegin(dbapi_conn, _connection_record) -> None:
+    dbapi_conn.isolation_level = None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_engine():
+    """Create the in-memory test database and its tables once per session.
+
+    WHY: StaticPool keeps the single in-memory connection (and with it the
+    database) alive for the whole session, so create_all runs once instead
+    of create_all/drop_all around every test.
+    """
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=StaticPool)
+    # WHY: Same connection PRAGMAs as the production engines, so tests run
+    # against the configuration the API actually uses.
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    event.listen(engine.sync_engine, "connect", _disable_autobegin)
+    event.listen(engine.sync_engine, "begin", _begin_explicitly)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield engine
+
+    await engine.dispose()
+
 
-    async with session_factory() as session:
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def async_db_session(db_engine):
+    """Yield an async DB session whose changes are rolled back after the test.
+
+    Each test runs inside an outer transaction; commits made by the code
+    under test only release SAVEPOINTs, and the final rollback leaves the
+    database empty for the next test.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
         yield session
+        await session.close()
+        await transaction.rollback()
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def seed_jobs(async_db_session: AsyncSession) -> list[Job]:
+    """Insert two queued jobs directly, bypassing the create endpoint.
+
+    WHY: Tests of list/get/delete only need rows to exist; going through
+    POST /api/jobs/ would re-test request validation and enqueueing in
+    every one of them. test_create_job_* cover that path.
+    """
+    jobs = [
+        Job(id=str(uuid.uuid4()), url="https://example.com/video1.mp4"),
+        Job(id=str(uuid.uuid4()), url="https://example.com/video2.mp4"),
+    ]
+    async_db_session.add_all(jobs)
+    await async_db_session.commit()
+    return jobs
 
 
 # ---------------------------------------------------------------------------
@@ -92,8 +155,23 @@ async def async_db_session():
 # ---------------------------------------------------------------------------
 
 
-@pytest_asyncio.fixture(scope="function")
-async def client(async_db_session: AsyncSession):
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """One httpx AsyncClient on the shared app for the whole test session.
+
+    WHY: create_app() is cached, so only the client and its ASGI transport
+    were rebuilt per test; per-test state lives in dependency_overrides,
+    which the client fixture sets and clears.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=create_app()),
+        base_url="http://testserver",
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def client(http_client: AsyncClient, async_db_session: AsyncSession):
     """Provide an httpx AsyncClient wired to the FastAPI app with test DB.
 
     Overrides the get_db dependency so all endpoints use the in-memory
@@ -105,15 +183,7 @@ async def client(async_db_session: AsyncSession):
 
     app = create_app()
     app.dependency_overrides[get_db] = _override_get_db
-
-    # Patch the module-level queue in the jobs router to use our mock
-    with patch("app.routes.jobs.queue", _mock_queue_instance):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://testserver",
-        ) as ac:
-            yield ac
-
+    yield http_client
     app.dependency_overrides.clear()
 
 
@@ -122,14 +192,18 @@ async def client(async_db_session: AsyncSession):
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def sample_segments() -> list[Segment]:
-    """A small list of segments for format conversion tests."""
-    return [
+@pytest.fixture(scope="session")
+def sample_segments() -> tuple[Segment, ...]:
+    """A small sequence of segments for format conversion tests.
+
+    Session-scoped so class-scoped fixtures can build on it; a tuple of
+    frozen Segments, so no test can alter it for the next one.
+    """
+    return (
         Segment(start=0.0, end=2.5, text="Hello world"),
         Segment(start=2.5, end=5.0, text="This is a test"),
         Segment(start=5.0, end=8.123, text="Third segment here"),
-    ]
+    )
 
 
 @pytest.fixture
@@ -4,19 +4,26 @@ Uses httpx AsyncClient with an in-memory SQLite database.
 Redis and RQ are fully mocked -- no external services needed.
 """
 
+import dataclasses
+import uuid
+
 import pytest
 
+from app.config import get_settings
+from app.models import Job
+from app.routes import jobs as jobs_module
+
+pytestmark = pytest.mark.anyio
+
 
 # ---- Health endpoint -----------------------------------------------------
 
 
-@pytest.mark.anyio
 async def test_health_returns_200(client):
     response = await client.get("/api/health")
     assert response.status_code == 200
 
 
-@pytest.mark.anyio
 async def test_health_response_body(client):
     response = await client.get("/api/health")
     data = response.json()
@@ -27,7 +34,6 @@ async def test_health_response_body(client):
 # ---- POST /api/jobs (create job) -----------------------------------------
 
 
-@pytest.mark.anyio
 async def test_create_job_valid_url(client):
     response = await client.post(
         "/api/jobs/",
@@ -40,7 +46,6 @@ async def test_create_job_valid_url(client):
     assert data["status"] == "queued"
 
 
-@pytest.mark.anyio
 async def test_create_job_with_language(client):
     response = await client.post(
         "/api/jobs/",
@@ -50,13 +55,11 @@ async def test_create_job_with_language(client):
     assert response.json()["language"] == "de"
 
 
-@pytest.mark.anyio
 async def test_create_job_invalid_url(client):
     response = await client.post("/api/jobs/", json={"url": "not-a-url"})
     assert response.status_code == 422  # Pydantic validation error
 
 
-@pytest.mark.anyio
 async def test_create_job_missing_url(client):
     response = await client.post("/api/jobs/", json={})
     assert response.status_code == 422
@@ -65,37 +68,21 @@ async def test_create_job_missing_url(client):
 # ---- GET /api/jobs (list jobs) -------------------------------------------
 
 
-@pytest.mark.anyio
 async def test_list_jobs_empty(client):
     response = await client.get("/api/jobs/")
     assert response.status_code == 200
     assert response.json() == []
 
 
-@pytest.mark.anyio
-async def test_list_jobs_after_create(client):
-    await client.post(
-        "/api/jobs/",
-        json={"url": "https://example.com/video1.mp4"},
-    )
-    await client.post(
-        "/api/jobs/",
-        json={"url": "https://example.com/video2.mp4"},
-    )
-
+async def test_list_jobs_after_create(client, seed_jobs):
     response = await client.get("/api/jobs/")
     assert response.status_code == 200
     jobs = response.json()
     assert len(jobs) == 2
 
 
-@pytest.mark.anyio
-async def test_list_jobs_excludes_result_text(client):
+async def test_list_jobs_excludes_result_text(client, seed_jobs):
     """JobListResponse should not include result_text field."""
-    await client.post(
-        "/api/jobs/",
-        json={"url": "https://example.com/video.mp4"},
-    )
     response = await client.get("/api/jobs/")
     jobs = response.json()
     assert "result_text" not in jobs[0]
@@ -104,20 +91,14 @@ async def test_list_jobs_excludes_result_text(client):
 # ---- GET /api/jobs/{id} (get single job) ---------------------------------
 
 
-@pytest.mark.anyio
-async def test_get_job_exists(client):
-    create_resp = await client.post(
-        "/api/jobs/",
-        json={"url": "https://example.com/video.mp4"},
-    )
-    job_id = create_resp.json()["id"]
+async def test_get_job_exists(client, seed_jobs):
+    job_id = seed_jobs[0].id
 
     response = await client.get(f"/api/jobs/{job_id}")
     assert response.status_code == 200
     assert response.json()["id"] == job_id
 
 
-@pytest.mark.anyio
 async def test_get_job_not_found(client):
     response = await client.get("/api/jobs/nonexistent-id-12345")
     assert response.status_code == 404
@@ -127,24 +108,87 @@ async def test_get_job_not_found(client):
 # ---- DELETE /api/jobs/{id} -----------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_delete_job_exists(client):
-    create_resp = await client.post(
-        "/api/jobs/",
-        json={"url": "https://example.com/video.mp4"},
-    )
-    job_id = create_resp.json()["id"]
+async def test_delete_job_exists(client, seed_jobs, async_db_session):
+    job_id = seed_jobs[0].id
 
     response = await client.delete(f"/api/jobs/{job_id}")
     assert response.status_code == 204
 
-    # Verify it is gone
-    get_resp = await client.get(f"/api/jobs/{job_id}")
-    assert get_resp.status_code == 404
+    # Verify the row is gone (not just hidden by the endpoint)
+    assert await async_db_session.get(Job, job_id) is None
+
+
+async def test_delete_job_removes_job_dir(client, seed_jobs, tmp_path, monkeypatch):
+    test_settings = dataclasses.replace(get_settings(), data_dir=tmp_path)
+    monkeypatch.setattr(jobs_module, "get_settings", lambda: test_settings)
+
+    job_id = seed_jobs[0].id
+    job_dir = tmp_path / job_id
+    job_dir.mkdir()
+    (job_dir / "audio.m4a").write_bytes(b"\0" * 1024)
+
+    response = await client.delete(f"/api/jobs/{job_id}")
+    assert response.status_code == 204
+    assert not job_dir.exists()
 
 
-@pytest.mark.anyio
 async def test_delete_job_not_found(client):
     response = await client.delete("/api/jobs/nonexistent-id-12345")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
+
+
+# ---- ETag / If-None-Match ------------------------------------------------
+
+
+async def test_list_jobs_not_modified(client, seed_jobs):
+    first = await client.get("/api/jobs/")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    second = await client.get("/api/jobs/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+async def test_list_jobs_etag_changes_with_content(client, async_db_session):
+    first = await client.get("/api/jobs/")
+    # Inserted directly: POST resolves the host, which needs network access.
+    async_db_session.add(Job(id=str(uuid.uuid4()), url="https://example.com/video.mp4"))
+    await async_db_session.commit()
+
+    second = await client.get(
+        "/api/jobs/", headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert second.status_code == 200
+    assert len(second.json()) == 1
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+async def test_get_job_not_modified(client, seed_jobs):
+    job_id = seed_jobs[0].id
+
+    first = await client.get(f"/api/jobs/{job_id}")
+    etag = first.headers["etag"]
+    second = await client.get(
+        f"/api/jobs/{job_id}", headers={"If-None-Match": f'"other", {etag}'}
+    )
+    assert second.status_code == 304
+
+
+# ---- GET /api/jobs/{id}/download/{fmt} -----------------------------------
+
+
+async def test_download_invalid_format(client):
+    response = await client.get(f"/api/jobs/{uuid.uuid4()}/download/docx")
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "Invalid format 'docx'. Must be one of: json, srt, txt, vtt"
+    )
+
+
+async def test_download_job_not_found(client):
+    response = await client.get(f"/api/jobs/{uuid.uuid4()}/download/srt")
+    assert response.status_code == 404
+
@@ -0,0 +1,106 @@
+"""Tests for the stale job directory cleanup.
+
+WHY: cleanup_old_files deletes directories from the shared data volume.
+These tests pin exactly what counts as stale so a regression can never
+remove fresh job directories or non-directory files.
+"""
+
+import os
+import time
+
+import pytest
+
+from app.config import Settings
+from app.worker import cleanup
+from app.worker.cleanup import cleanup_if_due, cleanup_old_files
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point cleanup at a temporary data_dir with a 1h max age."""
+    settings = Settings(data_dir=tmp_path, cleanup_max_age_hours=1)
+    monkeypatch.setattr(cleanup, "get_settings", lambda: settings)
+    return tmp_path
+
+
+def _age(path, hours: float) -> None:
+    """Backdate a path's mtime by the given number of hours."""
+    old = time.time() - hours * 3600
+    os.utime(path, (old, old))
+
+
+class TestCleanupOldFiles:
+    def test_removes_only_stale_directories(self, data_dir):
+        stale = data_dir / "stale-job"
+        stale.mkdir()
+        (stale / "audio.webm").write_bytes(b"x")
+        _age(stale, 2)
+        fresh = data_dir / "fresh-job"
+        fresh.mkdir()
+
+        assert cleanup_old_files() == 1
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_ignores_files(self, data_dir):
+        db_file = data_dir / "tscribe.db"
+        db_file.write_bytes(b"")
+        _age(db_file, 48)
+
+        assert cleanup_old_files() == 0
+        assert db_file.exists()
+
+    def test_removes_many_directories(self, data_dir):
+        for i in range(20):
+            job_dir = data_dir / f"job-{i}"
+            job_dir.mkdir()
+            _age(job_dir, 5)
+
+        assert cleanup_old_files() == 20
+        assert list(data_dir.iterdir()) == []
+
+    def test_missing_data_dir(self, data_dir):
+        data_dir.rmdir()
+        assert cleanup_old_files() == 0
+
+    def test_expires_subtitle_cache_entries_individually(self, data_dir):
+        cache_dir = data_dir / cleanup.SUBTITLE_CACHE_DIR_NAME
+        cache_dir.mkdir()
+        stale_entry = cache_dir / "stale.json"
+        stale_entry.write_bytes(b"[]")
+        _age(stale_entry, 2)
+        fresh_entry = cache_dir / "fresh.json"
+        fresh_entry.write_bytes(b"[]")
+
+        # The directory itself looks stale but still holds a fresh entry.
+        _age(cache_dir, 2)
+
+        assert cleanup_old_files() == 1
+        assert not stale_entry.exists()
+        assert fresh_entry.exists()
+
+
+class TestCleanupIfDue:
+    def test_runs_then_waits_for_interval(self, data_dir):
+        for name in ("job-a", "job-b"):
+            (data_dir / name).mkdir()
+            _age(data_dir / name, 2)
+
+        assert cleanup_if_due() == 2
+
+        (data_dir / "job-c").mkdir()
+        _age(data_dir / "job-c", 2)
+        assert cleanup_if_due() == 0
+        assert (data_dir / "job-c").exists()
+
+    def test_runs_again_after_interval(self, data_dir):
+        cleanup_if_due()
+        _age(data_dir / cleanup._STAMP_FILE_NAME, 1)
+        (data_dir / "job-a").mkdir()
+        _age(data_dir / "job-a", 2)
+
+        assert cleanup_if_due() == 1
+
+    def test_missing_data_dir(self, data_dir):
+        data_dir.rmdir()
+        assert cleanup_if_due() == 0
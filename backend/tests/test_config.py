@@ -0,0 +1,92 @@
+"""Tests for the environment-based settings loader.
+
+WHY: Settings are parsed from plain strings at startup. These tests pin the
+coercion rules (bool, int, Path, list) and the env-over-.env precedence so
+a typo in a deployment fails loudly instead of silently using defaults.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.config import Settings, _load, get_settings
+
+
+class TestLoadSettings:
+    def test_defaults_without_env(self):
+        settings = _load({}, env_file=None)
+        assert settings == Settings()
+        assert settings.cors_origins == ["*"]
+
+    def test_prefix_and_types(self):
+        settings = _load(
+            {
+                "TSCRIBE_DEBUG": "true",
+                "TSCRIBE_JOB_TIMEOUT_SECONDS": "60",
+                "TSCRIBE_DATA_DIR": "/tmp/tscribe",
+                "DEBUG": "false",  # no prefix -- ignored
+            },
+            env_file=None,
+        )
+        assert settings.debug is True
+        assert settings.job_timeout_seconds == 60
+        assert settings.data_dir == Path("/tmp/tscribe")
+
+    def test_cors_origins_json_list(self):
+        settings = _load(
+            {"TSCRIBE_CORS_ORIGINS": '["https://a.example", "https://b.example"]'},
+            env_file=None,
+        )
+        assert settings.cors_origins == ["https://a.example", "https://b.example"]
+
+    def test_cors_origins_comma_separated(self):
+        settings = _load(
+            {"TSCRIBE_CORS_ORIGINS": "https://a.example, http://localhost:5173"},
+            env_file=None,
+        )
+        assert settings.cors_origins == ["https://a.example", "http://localhost:5173"]
+
+    def test_invalid_bool_raises(self):
+        with pytest.raises(ValueError, match="TSCRIBE_DEBUG"):
+            _load({"TSCRIBE_DEBUG": "maybe"}, env_file=None)
+
+    def test_invalid_int_raises(self):
+        with pytest.raises(ValueError, match="TSCRIBE_CLEANUP_MAX_AGE_HOURS"):
+            _load({"TSCRIBE_CLEANUP_MAX_AGE_HOURS": "soon"}, env_file=None)
+
+    def test_env_file_is_read_and_env_wins(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comment\n"
+            "TSCRIBE_WHISPER_MODEL=small\n"
+            'TSCRIBE_LOG_LEVEL="DEBUG"\n'
+        )
+        settings = _load({"TSCRIBE_WHISPER_MODEL": "tiny"}, env_file=env_file)
+        assert settings.whisper_model == "tiny"
+        assert settings.log_level == "DEBUG"
+
+    def test_sync_database_url(self):
+        assert Settings().sync_database_url == "sqlite:////data/tscribe.db"
+        settings = Settings(database_url="postgresql+asyncpg://u:p@db/tscribe")
+        assert settings.sync_database_url == "postgresql+psycopg2://u:p@db/tscribe"
+        # Already-sync URLs pass through unchanged.
+        assert Settings(database_url="sqlite:///x.db").sync_database_url == "sqlite:///x.db"
+
+    def test_settings_are_frozen(self):
+        settings = _load({}, env_file=None)
+        with pytest.raises(AttributeError):
+            settings.debug = True
+
+
+class TestGetSettings:
+    def test_returns_cached_instance(self):
+        assert get_settings() is get_settings()
+
+    def test_cache_clear_reloads(self, monkeypatch):
+        monkeypatch.setenv("TSCRIBE_WHISPER_MODEL", "tiny")
+        get_settings.cache_clear()
+        try:
+            assert get_settings().whisper_model == "tiny"
+        finally:
+            monkeypatch.undo()
+            get_settings.cache_clear()
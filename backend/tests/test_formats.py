@@ -7,14 +7,21 @@ no external dependencies.
 
 import json
 
+import pytest
+
 from app.worker.formats import (
     format_timestamp_srt,
     format_timestamp_vtt,
+    iter_json,
+    iter_srt,
+    iter_txt,
+    iter_vtt,
     to_json,
     to_srt,
     to_txt,
     to_vtt,
 )
+from app.worker.segments import Segment, segments_from_rows, segments_to_storage
 
 
 # ---- Timestamp formatting ------------------------------------------------
@@ -39,6 +46,21 @@ class TestFormatTimestampSrt:
         result = format_timestamp_srt(0.001)
         assert result == "00:00:00,001"
 
+    def test_rounding_carries_into_seconds(self):
+        """Milliseconds that round up to 1000 carry instead of printing 1000."""
+        assert format_timestamp_srt(1.9996) == "00:00:02,000"
+        assert format_timestamp_srt(3599.9999) == "01:00:00,000"
+
+    def test_half_millisecond_ties(self):
+        """Ties round on seconds * 1000, not on the fractional part alone.
+
+        The product and the fraction carry different float error, so near
+        half a millisecond the result can differ from the old per-field
+        formatter (which gave ,005 and ,707 here).
+        """
+        assert format_timestamp_srt(25818.0055) == "07:10:18,006"
+        assert format_timestamp_srt(16343.7065) == "04:32:23,706"
+
     def test_comma_separator(self):
         """SRT uses comma, not dot, as decimal separator."""
         result = format_timestamp_srt(1.0)
@@ -175,25 +197,24 @@ class TestToTxt:
 
 
 class TestToJson:
-    def test_valid_json(self, sample_segments):
-        result = to_json(sample_segments)
-        data = json.loads(result)
-        assert isinstance(data, list)
+    @pytest.fixture(scope="class")
+    def decoded(self, sample_segments):
+        """to_json(sample_segments) parsed back, shared by the class."""
+        return json.loads(to_json(sample_segments))
 
-    def test_segment_structure(self, sample_segments):
-        result = to_json(sample_segments)
-        data = json.loads(result)
-        assert len(data) == 3
+    def test_valid_json(self, decoded):
+        assert isinstance(decoded, list)
+
+    def test_segment_structure(self, decoded):
+        assert len(decoded) == 3
 
-        first = data[0]
+        first = decoded[0]
         assert first["start"] == 0.0
         assert first["end"] == 2.5
         assert first["text"] == "Hello world"
 
-    def test_all_fields_present(self, sample_segments):
-        result = to_json(sample_segments)
-        data = json.loads(result)
-        for seg in data:
+    def test_all_fields_present(self, decoded):
+        for seg in decoded:
             assert "start" in seg
             assert "end" in seg
             assert "text" in seg
@@ -210,8 +231,55 @@ class TestToJson:
         assert len(data) == 1
         assert data[0]["text"] == "Only segment"
 
-    def test_preserves_float_precision(self, sample_segments):
+    def test_preserves_float_precision(self, decoded):
         """Timestamps like 8.123 should not lose precision in JSON."""
-        result = to_json(sample_segments)
-        data = json.loads(result)
-        assert data[2]["end"] == 8.123
+        assert decoded[2]["end"] == 8.123
+
+
+# ---- Streaming variants --------------------------------------------------
+
+
+class TestIterFormats:
+    """The iter_* generators must produce exactly the to_* output."""
+
+    def test_srt_matches(self, sample_segments):
+        assert "".join(iter_srt(sample_segments)) == to_srt(sample_segments)
+
+    def test_vtt_matches(self, sample_segments):
+        assert "".join(iter_vtt(sample_segments)) == to_vtt(sample_segments)
+
+    def test_txt_matches(self, sample_segments):
+        assert "".join(iter_txt(sample_segments)) == to_txt(sample_segments)
+
+    def test_json_matches(self, sample_segments):
+        assert "".join(iter_json(sample_segments)) == to_json(sample_segments)
+
+    def test_empty_segments(self, empty_segments):
+        assert "".join(iter_srt(empty_segments)) == ""
+        assert "".join(iter_vtt(empty_segments)) == "WEBVTT\n"
+        assert "".join(iter_txt(empty_segments)) == ""
+        assert "".join(iter_json(empty_segments)) == "[]"
+
+
+# ---- Stored segment layout -----------------------------------------------
+
+
+class TestSegmentRows:
+    """result_segments_json stores positional rows; legacy dict rows still load."""
+
+    def test_rows_are_positional(self):
+        text, rows = segments_to_storage([Segment(0.0, 1.5, "Hi"), Segment(1.5, 2.0, "Ho")])
+        assert text == "Hi\nHo"
+        assert rows == [(0.0, 1.5, "Hi"), (1.5, 2.0, "Ho")]
+
+    def test_round_trip_through_json(self):
+        segments = [Segment(0.0, 1.5, "Grüß Gott"), Segment(1.5, 3.0, "Servus")]
+        _, rows = segments_to_storage(segments)
+        assert segments_from_rows(json.loads(json.dumps(rows))) == segments
+
+    def test_legacy_dict_rows(self):
+        rows = [{"start": 0.0, "end": 1.5, "text": "Hi"}]
+        assert segments_from_rows(rows) == [Segment(0.0, 1.5, "Hi")]
+
+    def test_empty(self):
+        assert segments_from_rows([]) == []
@@ -0,0 +1,44 @@
+"""Tests for job ids and job status values.
+
+WHY: Plain synchronous checks kept out of test_api.py, whose module-level
+anyio mark applies to async endpoint tests only.
+"""
+
+import time
+import uuid
+from typing import get_args
+
+from app.models import JobStatus
+from app.routes.jobs import _uuid7
+from app.schemas import JobStatusValue
+
+
+# ---- Job IDs --------------------------------------------------------------
+
+
+class TestUuid7:
+    def test_version_and_variant(self):
+        value = _uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_parses_as_uuid_string(self):
+        value = str(_uuid7())
+        assert uuid.UUID(value).version == 7
+
+    def test_sorts_by_creation_time(self):
+        first = _uuid7()
+        time.sleep(0.002)
+        second = _uuid7()
+        assert str(first) < str(second)
+
+    def test_unique(self):
+        assert len({_uuid7() for _ in range(1000)}) == 1000
+
+
+# ---- Schemas --------------------------------------------------------------
+
+
+def test_status_literal_matches_enum():
+    """JobStatusValue must list exactly the JobStatus values."""
+    assert set(get_args(JobStatusValue)) == {status.value for status in JobStatus}
@@ -0,0 +1,133 @@
+"""Tests for the forked worker pool in run_worker.py.
+
+WHY: The pool's signal and exit-code handling only matters during a
+shutdown or crash, which is hard to exercise by hand. os.fork, os.waitpid
+and os._exit are replaced so both the parent and the child side of
+_run_worker_pool run inside the test process.
+"""
+
+import signal
+
+import pytest
+
+import run_worker
+
+
+class _ChildExit(Exception):
+    """Raised by the fake os._exit so the test regains control."""
+
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    """Record signal.signal calls instead of changing this process's handlers."""
+    installed = {}
+    monkeypatch.setattr(
+        run_worker.signal, "signal", lambda signum, handler: installed.__setitem__(signum, handler)
+    )
+    return installed
+
+
+def _exit_status(code: int) -> int:
+    """Build a waitpid status word for a child that exited with `code`."""
+    return code << 8
+
+
+class TestParent:
+    def test_handlers_installed_before_fork(self, handlers, monkeypatch):
+        seen_at_fork = []
+        pids = iter([101, 102])
+
+        def _fork():
+            seen_at_fork.append(dict(handlers))
+            return next(pids)
+
+        monkeypatch.setattr(run_worker.os, "fork", _fork)
+        monkeypatch.setattr(run_worker.os, "waitpid", lambda pid, _: (pid, _exit_status(0)))
+
+        with pytest.raises(SystemExit) as exc_info:
+            run_worker._run_worker_pool(2)
+
+        assert exc_info.value.code == 0
+        for seen in seen_at_fork:
+            assert callable(seen[signal.SIGTERM])
+            assert seen[signal.SIGINT] is signal.SIG_IGN
+
+    def test_forwards_sigterm_only_once(self, handlers, monkeypatch):
+        pids = iter([101, 102])
+        killed = []
+        monkeypatch.setattr(run_worker.os, "fork", lambda: next(pids))
+        monkeypatch.setattr(run_worker.os, "kill", lambda pid, signum: killed.append((pid, signum)))
+
+        def _waitpid(pid, _options):
+            if pid == 101:
+                handlers[signal.SIGTERM](signal.SIGTERM, None)
+            return pid, _exit_status(0)
+
+        monkeypatch.setattr(run_worker.os, "waitpid", _waitpid)
+
+        with pytest.raises(SystemExit):
+            run_worker._run_worker_pool(2)
+
+        assert killed == [(101, signal.SIGTERM), (102, signal.SIGTERM)]
+
+    def test_failed_child_fails_the_pool(self, handlers, monkeypatch):
+        pids = iter([101, 102])
+        monkeypatch.setattr(run_worker.os, "fork", lambda: next(pids))
+        monkeypatch.setattr(
+            run_worker.os,
+            "waitpid",
+            lambda pid, _: (pid, _exit_status(1 if pid == 102 else 0)),
+        )
+
+        with pytest.raises(SystemExit) as exc_info:
+            run_worker._run_worker_pool(2)
+
+        assert exc_info.value.code == 1
+
+
+class TestChild:
+    @pytest.fixture
+    def run_child(self, handlers, monkeypatch):
+        """Run the child side of a one-worker pool with the given _run_worker."""
+
+        def _exit(code):
+            raise _ChildExit(code)
+
+        monkeypatch.setattr(run_worker.os, "fork", lambda: 0)
+        monkeypatch.setattr(run_worker.os, "_exit", _exit)
+        monkeypatch.setattr(run_worker.logging, "shutdown", lambda: None)
+
+        def _run(worker):
+            monkeypatch.setattr(run_worker, "_run_worker", worker)
+            with pytest.raises(_ChildExit) as exc_info:
+                run_worker._run_worker_pool(1)
+            return exc_info.value.code
+
+        return _run
+
+    def test_resets_signal_handlers(self, run_child, handlers):
+        seen = {}
+
+        def _worker(name):
+            seen.update(handlers)
+
+        assert run_child(_worker) == 0
+        assert seen[signal.SIGTERM] is signal.SIG_DFL
+        assert seen[signal.SIGINT] is signal.SIG_DFL
+
+    @pytest.mark.parametrize(("code", "expected"), [(None, 0), (0, 0), (3, 3), ("bye", 1)])
+    def test_passes_through_system_exit(self, run_child, code, expected):
+        def _worker(name):
+            raise SystemExit(code)
+
+        assert run_child(_worker) == expected
+
+    def test_crash_exits_with_1(self, run_child):
+        def _worker(name):
+            raise RuntimeError("redis down")
+
+        assert run_child(_worker) == 1
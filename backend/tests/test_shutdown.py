@@ -0,0 +1,27 @@
+"""Tests for the cooperative shutdown event.
+
+WHY: The transcription loop relies on check_shutdown() raising as soon as
+SIGTERM was seen, so a stopped container fails the job instead of leaving
+it in TRANSCRIBING.
+"""
+
+import pytest
+
+from app.worker import shutdown
+
+
+@pytest.fixture(autouse=True)
+def _reset_event():
+    shutdown.SHUTDOWN_EVENT.clear()
+    yield
+    shutdown.SHUTDOWN_EVENT.clear()
+
+
+def test_check_shutdown_passes_when_not_requested():
+    shutdown.check_shutdown()
+
+
+def test_check_shutdown_raises_once_event_is_set():
+    shutdown.SHUTDOWN_EVENT.set()
+    with pytest.raises(shutdown.ShutdownInterrupt):
+        shutdown.check_shutdown()
@@ -5,19 +5,19 @@ ensure the VTT/json3 parsers produce correct Segment data and that the
 subtitle selection logic picks the right track.
 """
 
+import dataclasses
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# WHY: Import Segment from conftest (which provides the test-compatible
-# version without requiring faster-whisper to be installed).
-from conftest import Segment
-
+from app.config import get_settings
+from app.worker.segments import Segment
 from app.worker.subtitles import (
     _parse_json3_subtitles,
     _parse_vtt_subtitles,
     _select_subtitle_key,
+    fetch_subtitles,
 )
 
 
@@ -113,6 +113,20 @@ class TestParseVttSubtitles:
         assert segments[0].text == "First"
         assert segments[1].text == "Second"
 
+    def test_vtt_cue_ends_at_next_timing_line(self):
+        """Cue text stops at the next timing line even without a blank line."""
+        vtt = (
+            "WEBVTT\n"
+            "\n"
+            "00:00:01.000 --> 00:00:03.000\n"
+            "First\n"
+            "00:00:03.000 --> 00:00:05.000\n"
+            "Second\n"
+        )
+        segments = _parse_vtt_subtitles(vtt)
+        assert [seg.text for seg in segments] == ["First", "Second"]
+        assert segments[1].start == 3.0
+
 
 # ---------------------------------------------------------------------------
 # json3 parser tests
@@ -261,3 +275,99 @@ class TestSelectSubtitleKey:
         """Returns None with empty dicts and no language."""
         result = _select_subtitle_key({}, {}, None)
         assert result is None
+
+
+# ---------------------------------------------------------------------------
+# fetch_subtitles tests
+# ---------------------------------------------------------------------------
+
+
+class TestFetchSubtitles:
+    """Tests for the yt-dlp driven fetch (network mocked)."""
+
+    @staticmethod
+    def _mock_ydl(info: dict, body: bytes) -> MagicMock:
+        ydl = MagicMock()
+        ydl.__enter__.return_value = ydl
+        ydl.extract_info.return_value = info
+        ydl.urlopen.return_value.read.return_value = body
+        return ydl
+
+    def test_single_youtubedl_for_probe_and_download(self):
+        """Metadata probe and json3 download share one YoutubeDL instance."""
+        info = {
+            "title": "Clip",
+            "duration": 12,
+            "subtitles": {"de": [{"ext": "json3", "url": "https://sub/json3"}]},
+        }
+        body = json.dumps(
+            {"events": [{"tStartMs": 0, "dDurationMs": 1500, "segs": [{"utf8": "Servus"}]}]}
+        ).encode()
+        ydl = self._mock_ydl(info, body)
+
+        with patch("app.worker.subtitles.yt_dlp.YoutubeDL", return_value=ydl) as ctor:
+            result = fetch_subtitles("https://video", "de")
+
+        assert ctor.call_count == 1
+        ydl.urlopen.assert_called_once_with("https://sub/json3")
+        assert result.title == "Clip"
+        assert result.duration == 12.0
+        assert result.result.language == "de"
+        assert [s.text for s in result.result.segments] == ["Servus"]
+
+    def test_vtt_fallback_uses_same_instance(self):
+        """Without json3 the VTT track is fetched through the same ydl."""
+        info = {
+            "title": "Clip",
+            "duration": 5,
+            "automatic_captions": {"en": [{"ext": "vtt", "url": "https://sub/vtt"}]},
+        }
+        body = b"WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello\n"
+        ydl = self._mock_ydl(info, body)
+
+        with patch("app.worker.subtitles.yt_dlp.YoutubeDL", return_value=ydl) as ctor:
+            result = fetch_subtitles("https://video", None)
+
+        assert ctor.call_count == 1
+        ydl.urlopen.assert_called_once_with("https://sub/vtt")
+        assert [s.text for s in result.result.segments] == ["Hello"]
+
+    def test_extraction_failure_returns_none(self):
+        """A failing metadata probe falls back to the download pipeline."""
+        ydl = self._mock_ydl({}, b"")
+        ydl.extract_info.side_effect = RuntimeError("private video")
+
+        with patch("app.worker.subtitles.yt_dlp.YoutubeDL", return_value=ydl):
+            assert fetch_subtitles("https://video", "de") is None
+
+    def test_track_is_cached_by_video_id(self, tmp_path, monkeypatch):
+        """A second fetch of the same video reuses the parsed track."""
+        test_settings = dataclasses.replace(get_settings(), data_dir=tmp_path)
+        monkeypatch.setattr("app.worker.subtitles.get_settings", lambda: test_settings)
+        info = {
+            "id": "abc123",
+            "extractor_key": "Youtube",
+            "title": "Clip",
+            "duration": 5,
+            "subtitles": {"de": [{"ext": "json3", "url": "https://sub/json3"}]},
+        }
+        body = json.dumps(
+            {"events": [{"tStartMs": 0, "dDurationMs": 1000, "segs": [{"utf8": "Servus"}]}]}
+        ).encode()
+
+        first_ydl = self._mock_ydl(info, body)
+        with patch("app.worker.subtitles.yt_dlp.YoutubeDL", return_value=first_ydl):
+            first = fetch_subtitles("https://youtu.be/abc123", "de")
+
+        second_ydl = self._mock_ydl(info, b"")
+        with patch("app.worker.subtitles.yt_dlp.YoutubeDL", return_value=second_ydl):
+            second = fetch_subtitles("https://www.youtube.com/watch?v=abc123", "de")
+
+        first_ydl.urlopen.assert_called_once()
+        second_ydl.urlopen.assert_not_called()
+        assert [(s.start, s.end, s.text) for s in second.result.segments] == [
+            (0.0, 1.0, "Servus")
+        ]
+        assert [(s.start, s.end, s.text) for s in first.result.segments] == [
+            (0.0, 1.0, "Servus")
+        ]
@@ -0,0 +1,267 @@
+"""Tests for the worker pipeline in app.worker.tasks.
+
+WHY: process_job is the only place job rows reach a terminal state. These
+tests run it against an in-memory StaticPool engine with the network and
+Whisper steps stubbed out, so the status transitions it writes are pinned
+without yt-dlp, faster-whisper or Redis.
+"""
+
+import dataclasses
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.config import get_settings
+from app.database import Base
+from app.models import Job, JobStatus
+from app.worker import tasks
+from app.worker.download import DownloadResult
+from app.worker.segments import Segment, TranscriptionResult
+from app.worker.subtitles import SubtitleInfo
+
+JOB_ID = "00000000-0000-4000-8000-000000000001"
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Point the worker at a fresh in-memory database holding one queued job."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Job(id=JOB_ID, url="https://example.com/video.mp4"))
+        session.commit()
+
+    settings = dataclasses.replace(get_settings(), data_dir=tmp_path)
+    monkeypatch.setattr(tasks, "sync_engine", engine)
+    monkeypatch.setattr(tasks, "get_settings", lambda: settings)
+    monkeypatch.setattr(tasks, "cleanup_if_due", lambda: 0)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def whisper_path(tmp_path, monkeypatch):
+    """Stub every pipeline step so process_job takes the Whisper path."""
+    monkeypatch.setattr(tasks, "fetch_subtitles", lambda url, language, cookiefile: None)
+    monkeypatch.setattr(
+        tasks,
+        "extract_audio",
+        lambda url, job_id: DownloadResult(
+            path=tmp_path / "audio.webm", title="Video", duration_ms=10_000
+        ),
+    )
+    monkeypatch.setattr(tasks, "preload_model", lambda: None)
+    monkeypatch.setattr(
+        tasks,
+        "transcribe_audio",
+        lambda path, language, on_segment=None: TranscriptionResult(
+            segments=[Segment(start=0.0, end=10.0, text="Hello")], language="en"
+        ),
+    )
+
+
+def _load(engine) -> Job:
+    with Session(engine) as session:
+        return session.get(Job, JOB_ID)
+
+
+class TestModelPreload:
+    def test_download_error_does_not_wait_for_preload(self, engine, whisper_path, monkeypatch):
+        release = threading.Event()
+
+        def _slow_preload():
+            release.wait(5)
+
+        def _failing_download(url, job_id):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(tasks, "preload_model", _slow_preload)
+        monkeypatch.setattr(tasks, "extract_audio", _failing_download)
+
+        started = time.monotonic()
+        try:
+            tasks.process_job(JOB_ID)
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        assert elapsed < 2
+        job = _load(engine)
+        assert job.status == JobStatus.FAILED
+        assert job.error == "RuntimeError: boom"
+
+    def test_preload_error_does_not_hide_download(self, engine, whisper_path, monkeypatch):
+        def _failing_preload():
+            raise RuntimeError("no model")
+
+        monkeypatch.setattr(tasks, "preload_model", _failing_preload)
+
+        tasks.process_job(JOB_ID)
+
+        job = _load(engine)
+        assert job.status == JobStatus.DONE
+        assert job.source == "whisper"
+        assert job.error is None
+
+
+@pytest.fixture
+def statuses(monkeypatch):
+    """Record every status process_job writes, in order."""
+    written = []
+    update_job = tasks._update_job
+
+    def _spy(session, job_id, **kwargs):
+        if "status" in kwargs:
+            written.append(kwargs["status"])
+        update_job(session, job_id, **kwargs)
+
+    monkeypatch.setattr(tasks, "_update_job", _spy)
+    return written
+
+
+class TestProcessJob:
+    def test_subtitle_path_reaches_done(self, engine, whisper_path, statuses, monkeypatch):
+        subtitle_info = SubtitleInfo(
+            title="Video",
+            duration=10.0,
+            result=TranscriptionResult(
+                segments=[Segment(start=0.0, end=10.0, text="Hello")], language="de"
+            ),
+        )
+        monkeypatch.setattr(
+            tasks, "fetch_subtitles", lambda url, language, cookiefile: subtitle_info
+        )
+
+        tasks.process_job(JOB_ID)
+
+        assert statuses == [JobStatus.DOWNLOADING, JobStatus.DONE]
+        job = _load(engine)
+        assert job.status == JobStatus.DONE
+        assert job.source == "subtitles"
+        assert job.detected_language == "de"
+        assert job.result_text == "Hello"
+
+    def test_whisper_path_reaches_done(self, engine, whisper_path, statuses):
+        tasks.process_job(JOB_ID)
+
+        assert statuses == [JobStatus.DOWNLOADING, JobStatus.TRANSCRIBING, JobStatus.DONE]
+        job = _load(engine)
+        assert job.status == JobStatus.DONE
+        assert job.progress == 100
+        assert job.source == "whisper"
+        assert job.title == "Video"
+        assert job.duration_seconds == 10.0
+        assert job.completed_at is not None
+
+    def test_mid_pipeline_error_marks_job_failed(
+        self, engine, whisper_path, statuses, tmp_path, monkeypatch
+    ):
+        def _failing_transcribe(path, language, on_segment=None):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(tasks, "transcribe_audio", _failing_transcribe)
+        (tmp_path / JOB_ID).mkdir()
+
+        tasks.process_job(JOB_ID)
+
+        assert statuses == [JobStatus.DOWNLOADING, JobStatus.TRANSCRIBING, JobStatus.FAILED]
+        job = _load(engine)
+        assert job.status == JobStatus.FAILED
+        assert job.error == "RuntimeError: boom"
+        assert job.progress == 5
+        assert job.completed_at is not None
+        assert not (tmp_path / JOB_ID).exists()
+
+    def test_unknown_job_is_skipped(self, engine, whisper_path, statuses):
+        tasks.process_job("00000000-0000-4000-8000-00000000ffff")
+
+        assert statuses == []
+        assert _load(engine).status == JobStatus.QUEUED
+
+
+class TestUpdateJob:
+    def test_writes_columns_and_commits(self, engine):
+        with Session(engine) as session:
+            tasks._update_job(session, JOB_ID, status=JobStatus.DOWNLOADING, progress=3)
+
+        job = _load(engine)
+        assert job.status == JobStatus.DOWNLOADING
+        assert job.progress == 3
+
+    def test_missing_job_raises(self, engine):
+        with Session(engine) as session, pytest.raises(ValueError, match="not found"):
+            tasks._update_job(session, "00000000-0000-4000-8000-00000000ffff", progress=50)
+
+
+@pytest.fixture
+def progress_writes(monkeypatch):
+    """Record the progress value of every _update_job call instead of writing it."""
+    written = []
+
+    def _record(session, job_id, **kwargs):
+        if "progress" in kwargs:
+            written.append(kwargs["progress"])
+
+    monkeypatch.setattr(tasks, "_update_job", _record)
+    return written
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace tasks.time with a clock that only moves when a test advances it."""
+    now = [1000.0]
+    monkeypatch.setattr(tasks, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+class TestProgressCallback:
+    def test_no_callback_without_duration(self):
+        assert tasks._progress_callback(None, JOB_ID, 0) is None
+
+    def test_writes_every_five_percent(self, progress_writes, clock):
+        on_segment = tasks._progress_callback(None, JOB_ID, 100.0)
+
+        for end in range(1, 101):
+            on_segment(Segment(start=end - 1, end=end, text="x"))
+
+        assert progress_writes == list(range(10, 100, 5))
+
+    def test_deadline_forces_small_step(self, progress_writes, clock):
+        on_segment = tasks._progress_callback(None, JOB_ID, 100.0)
+
+        on_segment(Segment(start=0.0, end=5.0, text="x"))
+        assert progress_writes == []
+
+        clock[0] += 30
+        on_segment(Segment(start=5.0, end=6.0, text="x"))
+        assert progress_writes == [10]
+
+        # The deadline restarts from the write, so the next small step waits.
+        on_segment(Segment(start=6.0, end=8.0, text="x"))
+        assert progress_writes == [10]
+
+    def test_final_write_is_always_100(
+        self, engine, whisper_path, progress_writes, clock, monkeypatch
+    ):
+        def _transcribe(path, language, on_segment=None):
+            segments = [Segment(start=i, end=i + 1.0, text="x") for i in range(10)]
+            for segment in segments:
+                on_segment(segment)
+            return TranscriptionResult(segments=segments, language="en")
+
+        monkeypatch.setattr(tasks, "transcribe_audio", _transcribe)
+
+        tasks.process_job(JOB_ID)
+
+        assert progress_writes[0] == 5
+        assert progress_writes[-1] == 100
+        assert progress_writes == sorted(progress_writes)